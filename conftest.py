@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--hdl-coverage",
+        action="store_true",
+        default=False,
+        help="Collect GHDL statement/branch coverage for tests marked with 'coverage'",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _hdl_coverage(request):
+    if not request.config.getoption("--hdl-coverage") or request.node.get_closest_marker("coverage") is None:
+        yield
+        return
+
+    previous = os.environ.get("LIB_COVERAGE")
+    os.environ["LIB_COVERAGE"] = "1"
+
+    yield
+
+    if previous is None:
+        del os.environ["LIB_COVERAGE"]
+    else:
+        os.environ["LIB_COVERAGE"] = previous
+
+
+def _coverage_session(session):
+    return session.config.getoption("--hdl-coverage") or os.environ.get("LIB_COVERAGE", "") not in ("", "0")
+
+
+def pytest_sessionstart(session):
+    if not _coverage_session(session) or hasattr(session.config, "workerinput"):
+        return
+
+    import lib
+
+    lib.Coverage.clear()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    import lib
+
+    try:
+        lib.Render_Pool.flush()
+    except ValueError as error:
+        session.config.get_terminal_writer().line(f"\n{error}", red=True)
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if not _coverage_session(session):
+        return
+
+    lib.Coverage.collect()
+
+    if not hasattr(session.config, "workerinput"):
+        print("\n" + lib.Coverage.report())
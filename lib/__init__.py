@@ -1,9 +1,8 @@
 import os
 import sys
 from pathlib import Path
-import pytest
 
-WORKSPACE_FOLDER = Path(os.getcwd()).absolute()
+WORKSPACE_FOLDER = Path(os.environ.get("LIB_WORKSPACE", os.getcwd())).absolute()
 
 if str(WORKSPACE_FOLDER) not in sys.path:
     sys.path.insert(0, str(WORKSPACE_FOLDER))
@@ -12,10 +11,28 @@ if str(WORKSPACE_FOLDER) not in sys.path:
 from lib.entity import Entity
 from lib.package import Package
 from lib.waveform import Waveform
+from lib.trace import Trace
 from lib.clockless_trace import Clockless_Trace
+from lib.sample_store import Sample_Store
 from lib.program import Program
+from lib.recorder import Recorder
+from lib.testbench import Testbench
+from lib.vector_driver import Vector_Driver
+from lib.watchdog import Watchdog
+from lib.coverage import Coverage
+from lib.activity_monitor import Activity_Monitor
+from lib.render_pool import Render_Pool
+from lib.render_cache import Render_Cache
+from lib.check_table import Check_Table
+from lib.vcd_writer import Vcd_Writer
+from lib.html_viewer import Html_Viewer
 from lib.utils import *
 
 
 def run_test(module: str):
-    pytest.main(["-k", os.path.basename(module)])
+    from lib.run import discover, run, print_progress
+
+    return run(discover([module], markers=None), progress=print_progress)
+
+
+run_tests = run_test
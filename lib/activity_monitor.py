@@ -0,0 +1,79 @@
+import os
+import typing as T
+from array import array
+from pathlib import Path
+
+import cocotb
+import cocotb.triggers
+
+
+class Activity_Monitor:
+    def __init__(self, *args: T.Any):
+        self.signals = list(args)
+        self.rises = array("Q", [0] * len(self.signals))
+        self.falls = array("Q", [0] * len(self.signals))
+        self._tasks: T.List[T.Any] = []
+
+    @staticmethod
+    def enabled():
+        return os.environ.get("LIB_ACTIVITY", "") not in ("", "0")
+
+    @staticmethod
+    def _levels(signal: T.Any):
+        value = signal.value
+
+        if isinstance(value, int):
+            return value & 0xFFFFFFFF, 0xFFFFFFFF
+
+        if not hasattr(value, "binstr"):
+            return None
+
+        if value.is_resolvable:
+            return value.integer, (1 << len(value.binstr)) - 1
+
+        binstr = value.binstr
+        ones = int("0" + "".join("1" if bit == "1" else "0" for bit in binstr), 2)
+        zeros = int("0" + "".join("1" if bit == "0" else "0" for bit in binstr), 2)
+
+        return ones, ones | zeros
+
+    async def _monitor(self, index: int):
+        signal = self.signals[index]
+        previous = self._levels(signal)
+
+        if previous is None:
+            return
+
+        while True:
+            await cocotb.triggers.Edge(signal)
+
+            current = self._levels(signal)
+            known = previous[1] & current[1]
+
+            self.rises[index] += bin(~previous[0] & current[0] & known).count("1")
+            self.falls[index] += bin(previous[0] & ~current[0] & known).count("1")
+
+            previous = current
+
+    def start(self):
+        self._tasks = [cocotb.start_soon(self._monitor(index)) for index in range(len(self.signals))]
+
+    def stop(self):
+        for task in self._tasks:
+            task.kill()
+
+        self._tasks = []
+
+    def write(self, filename: T.Union[str, Path], cycles: int = 0):
+        lines = ["signal,width,rises,falls,toggles,toggles_per_cycle"]
+
+        for index, signal in enumerate(self.signals):
+            toggles = self.rises[index] + self.falls[index]
+            rate = toggles / cycles if cycles else 0.0
+
+            lines.append(f"{signal._name},{len(signal)},{self.rises[index]},{self.falls[index]},{toggles},{rate:.6f}")
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "w") as report_file:
+            report_file.write("\n".join(lines) + "\n")
@@ -0,0 +1,169 @@
+import os
+import json
+import numbers
+import operator
+import typing as T
+from array import array
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+
+class Check_Table:
+    def __init__(self, testcase: str = ""):
+        self.testcase = testcase
+        self.pin_names: T.List[str] = []
+        self.pins = array("I")
+        self.cycles = array("Q")
+        self.times = array("d")
+        self.passed = array("b")
+        self.expected: T.List[T.Any] = []
+        self.actual: T.List[T.Optional[str]] = []
+        self.messages: T.List[str] = []
+        self._pin_index: T.Dict[str, int] = {}
+        self.widths: T.Dict[str, int] = {}
+
+    @staticmethod
+    def formats():
+        return [
+            name.strip().lower()
+            for name in os.environ.get("LIB_CHECKS", "").split(",")
+            if name.strip()
+        ]
+
+    @staticmethod
+    def normalize(value: T.Any) -> T.Union[int, T.Tuple[int, int], str]:
+        if isinstance(value, numbers.Integral):
+            return operator.index(value)
+
+        if isinstance(value, tuple):
+            return operator.index(value[0]), operator.index(value[1])
+
+        return str(value)
+
+    @classmethod
+    def pattern(cls, value: T.Union[int, T.Tuple[int, int]], width: int):
+        value = cls.normalize(value)
+        expected, care = (value, -1) if isinstance(value, int) else value
+        bits = format(expected & ((1 << width) - 1), f"0{width}b")
+
+        if care == -1:
+            return bits
+
+        care_bits = format(care & ((1 << width) - 1), f"0{width}b")
+
+        return "".join(bit if cared == "1" else "-" for bit, cared in zip(bits, care_bits))
+
+    def __len__(self):
+        return len(self.passed)
+
+    def add(
+        self,
+        pin: str,
+        expected: T.Any,
+        actual: T.Optional[str],
+        passed: bool,
+        time: float,
+        cycle: int,
+        message: str = "",
+        width: T.Optional[int] = None,
+    ):
+        if pin not in self._pin_index:
+            self._pin_index[pin] = len(self.pin_names)
+            self.pin_names.append(pin)
+
+        if width is not None:
+            self.widths[pin] = width
+
+        self.pins.append(self._pin_index[pin])
+        self.cycles.append(cycle)
+        self.times.append(time)
+        self.passed.append(1 if passed else 0)
+        self.expected.append(expected)
+        self.actual.append(None if passed else actual)
+        self.messages.append(message)
+
+        return passed
+
+    def failures(self):
+        return [index for index, passed in enumerate(self.passed) if not passed]
+
+    def record(self, index: int):
+        pin = self.pin_names[self.pins[index]]
+        expected = self.expected[index]
+
+        if not isinstance(expected, str):
+            expected = self.pattern(expected, self.widths[pin])
+
+        return {
+            "testcase": self.testcase,
+            "pin": pin,
+            "expected": expected,
+            "actual": expected if self.actual[index] is None else self.actual[index],
+            "time": self.times[index],
+            "cycle": self.cycles[index],
+            "passed": bool(self.passed[index]),
+            "message": self.messages[index],
+        }
+
+    def describe(self, index: int):
+        record = self.record(index)
+
+        return (
+            f"At pin \"{record['pin']}\" (cycle {record['cycle']}, {record['time']:g} ns): "
+            f"expected {record['expected']}, got {record['actual']}. {record['message']}"
+        )
+
+    def failure_message(self, limit: int = 50):
+        failures = self.failures()
+        lines = [self.describe(index) for index in failures[:limit]]
+
+        if len(failures) > limit:
+            lines.append(f"... {len(failures) - limit} more failed checks")
+
+        return "\n".join(lines)
+
+    def write_json(self, filename: T.Union[str, Path]):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "w") as json_file:
+            json.dump({
+                "testcase": self.testcase,
+                "checks": len(self),
+                "failures": len(self.failures()),
+                "records": [self.record(index) for index in range(len(self))],
+            }, json_file)
+
+    def write_junit(self, filename: T.Union[str, Path]):
+        failures = self.failures()
+        suite = ET.Element("testsuite", {
+            "name": self.testcase,
+            "tests": str(len(self)),
+            "failures": str(len(failures)),
+        })
+
+        for index in range(len(self)):
+            record = self.record(index)
+            case = ET.SubElement(suite, "testcase", {
+                "classname": self.testcase,
+                "name": f"{record['pin']}@{record['cycle']}",
+                "time": "0",
+            })
+
+            if not record["passed"]:
+                failure = ET.SubElement(case, "failure", {"message": self.describe(index)})
+                failure.text = json.dumps(record)
+
+        suites = ET.Element("testsuites")
+        suites.append(suite)
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        ET.ElementTree(suites).write(filename, encoding="unicode", xml_declaration=True)
+
+    def write(self, basename: T.Union[str, Path]):
+        for name in self.formats():
+            if name == "json":
+                self.write_json(f"{basename}.json")
+            elif name == "junit":
+                self.write_junit(f"{basename}.xml")
+            else:
+                raise ValueError(f"Unknown check report format \"{name}\"!")
@@ -1,42 +1,54 @@
-import json
-
-import cocotb.wavedrom
+import cocotb
 import cocotb.triggers
+import cocotb.utils
+
+from lib.trace import Trace
+from lib.sample_store import Sample_Store
 
 
-class Clockless_Trace(cocotb.wavedrom.trace):
+class Clockless_Trace(Trace):
     def __init__(self, *args):
-        self._signals = []
-        for arg in args:
-            self._signals.append(cocotb.wavedrom.Wavedrom(arg))
-        self._coro = None
+        super().__init__(*args, clk=None)
         self._cycles = 0
-        self._enabled = False
+        self._watchers = []
+        self._changed = cocotb.triggers.Event()
+
+    def _sample(self):
+        if not self._enabled or self._frozen:
+            return
+        self._cycles += 1
+        for sig in self._signals:
+            sig.sample()
+        if self.columns:
+            self.times.append(cocotb.utils.get_sim_time(units="ns"))
+        self._roll()
+
+    def sample_step(self, signal: Sample_Store):
+        # Reuse the column of the last change unless a check already marked it
+        if not signal.chars or signal.chars[-1] in b"79":
+            self._sample()
+
+    async def _watch(self, sig: Sample_Store):
+        edge = cocotb.triggers.Edge(sig.handle)
+        while True:
+            await edge
+            self._changed.set()
+
+    def suspend(self):
+        for watcher in self._watchers:
+            watcher.kill()
+        self._watchers = []
+        super().suspend()
 
     async def _monitor(self):
         self._cycles = 0
+        self._changed.clear()
+        self._watchers = [cocotb.start_soon(self._watch(sig)) for sig in self._signals]
+        await cocotb.triggers.ReadOnly()
+        self._sample()
         while True:
+            await self._changed.wait()
+            # Coalesce every change of this timestep into a single sample
             await cocotb.triggers.ReadOnly()
-            if not self._enabled:
-                continue
-            self._cycles += 1
-            for sig in self._signals:
-                sig.sample()
-
-    def dumpj(self, header="", footer="", config=""):
-        trace = {"signal": []}
-        for sig in self._signals:
-            trace["signal"].extend(sig.get(add_clock=False))
-        if header:
-            if isinstance(header, dict):
-                trace["head"] = header
-            else:
-                trace["head"] = {"text": header}
-        if footer:
-            if isinstance(footer, dict):
-                trace["foot"] = footer
-            else:
-                trace["foot"] = {"text": footer}
-        if config:
-            trace["config"] = config
-        return json.dumps(trace, indent=4, sort_keys=False)
+            self._changed.clear()
+            self._sample()
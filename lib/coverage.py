@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import shutil
+import subprocess
+import typing as T
+from pathlib import Path
+
+
+class Coverage:
+    BUILD_ARGS = ["-fprofile-arcs", "-ftest-coverage", "-Wl,-lgcov"]
+    DIRECTORY = Path("sim_build_coverage")
+
+    @staticmethod
+    def enabled():
+        return os.environ.get("LIB_COVERAGE", "") not in ("", "0")
+
+    @staticmethod
+    def worker():
+        return os.environ.get("PYTEST_XDIST_WORKER", os.environ.get("LIB_WORKER", "main"))
+
+    @classmethod
+    def build_dir(cls):
+        return (cls.DIRECTORY / cls.worker()).absolute()
+
+    @classmethod
+    def reports_dir(cls):
+        return (cls.DIRECTORY / "reports").absolute()
+
+    @classmethod
+    def clear(cls):
+        shutil.rmtree(cls.reports_dir(), ignore_errors=True)
+
+    @classmethod
+    def build(cls, entity: T.Any, sources: T.List[str], timeout: int = 600):
+        build_dir = cls.build_dir()
+        build_dir.mkdir(parents=True, exist_ok=True)
+
+        commands = [
+            ["ghdl", "-i", "--std=08", "--work=top", *sources],
+            ["ghdl", "-m", "--std=08", "--work=top", *cls.BUILD_ARGS, entity.__name__.lower()],
+        ]
+
+        for command in commands:
+            process = subprocess.Popen(
+                command,
+                cwd=build_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+
+            outs, errs = process.communicate(timeout=timeout)
+
+            assert process.returncode == 0, outs.decode()
+
+        return build_dir
+
+    @classmethod
+    def collect(cls, timeout: int = 600):
+        build_dir = cls.build_dir()
+        counters = [str(path) for path in build_dir.glob("*.gcda")]
+
+        if not counters:
+            return None
+
+        process = subprocess.Popen(
+            ["gcov", "--json-format", "--stdout", *counters],
+            cwd=build_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        outs, errs = process.communicate(timeout=timeout)
+
+        assert process.returncode == 0, errs.decode()
+
+        report: T.Dict[str, T.Dict[str, T.Any]] = {}
+
+        for document in outs.decode().splitlines():
+            if not document.strip():
+                continue
+
+            for source in json.loads(document)["files"]:
+                if not source["file"].lower().endswith(".vhd"):
+                    continue
+
+                lines = report.setdefault(source["file"], {"lines": {}, "branches": {}})
+
+                for line in source["lines"]:
+                    key = str(line["line_number"])
+                    lines["lines"][key] = lines["lines"].get(key, 0) + line["count"]
+                    counts = [branch["count"] for branch in line.get("branches", [])]
+
+                    if counts:
+                        previous = lines["branches"].get(key, [0] * len(counts))
+                        lines["branches"][key] = [a + b for a, b in zip(previous, counts)]
+
+        reports_dir = cls.reports_dir()
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        filename = reports_dir / f"{cls.worker()}-{os.getpid()}-{int(time.time())}.json"
+
+        with open(filename, "w") as report_file:
+            json.dump(report, report_file)
+
+        for counter in counters:
+            os.remove(counter)
+
+        return filename
+
+    @classmethod
+    def merge(cls, reports: T.Optional[T.List[Path]] = None):
+        merged: T.Dict[str, T.Dict[str, T.Any]] = {}
+
+        for filename in reports if reports is not None else sorted(cls.reports_dir().glob("*.json")):
+            with open(filename, "r") as report_file:
+                report = json.load(report_file)
+
+            for source, data in report.items():
+                target = merged.setdefault(source, {"lines": {}, "branches": {}})
+
+                for key, count in data["lines"].items():
+                    target["lines"][key] = target["lines"].get(key, 0) + count
+
+                for key, counts in data["branches"].items():
+                    previous = target["branches"].get(key, [0] * len(counts))
+                    target["branches"][key] = [a + b for a, b in zip(previous, counts)]
+
+        return merged
+
+    @staticmethod
+    def summarize(merged: T.Mapping[str, T.Mapping[str, T.Any]]):
+        rows = []
+
+        for source, data in sorted(merged.items()):
+            statements = len(data["lines"])
+            executed = sum(1 for count in data["lines"].values() if count > 0)
+            branches = sum(len(counts) for counts in data["branches"].values())
+            taken = sum(1 for counts in data["branches"].values() for count in counts if count > 0)
+
+            rows.append((source, executed, statements, taken, branches))
+
+        return rows
+
+    @classmethod
+    def report(cls, filename: T.Optional[Path] = None):
+        merged = cls.merge()
+        rows = cls.summarize(merged)
+        filename = filename or cls.DIRECTORY / "summary.txt"
+
+        def percent(hit: int, total: int):
+            return f"{100 * hit / total:6.1f}%" if total else "      -"
+
+        lines = [f"{'File':<48} {'Statements':>19} {'Branches':>19}"]
+
+        for source, executed, statements, taken, branches in rows:
+            lines.append(
+                f"{Path(source).name:<48} "
+                f"{executed:>5}/{statements:<5} {percent(executed, statements)} "
+                f"{taken:>5}/{branches:<5} {percent(taken, branches)}"
+            )
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "w") as summary_file:
+            summary_file.write("\n".join(lines) + "\n")
+
+        with open(filename.with_suffix(".json"), "w") as merged_file:
+            json.dump(merged, merged_file, indent=4)
+
+        return "\n".join(lines)
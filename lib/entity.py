@@ -15,6 +15,14 @@ import cocotb.triggers
 import lib
 from lib.package import Package
 from lib.waveform import Waveform
+from lib.recorder import Recorder
+from lib.testbench import Testbench
+from lib.watchdog import Watchdog
+from lib.coverage import Coverage
+from lib.activity_monitor import Activity_Monitor
+from lib.check_table import Check_Table
+from lib.vcd_writer import Vcd_Writer
+from lib.render_pool import Render_Pool
 
 
 _TESTCASE_TYPE = T.Union[
@@ -44,7 +52,16 @@ class Entity(T.Type[cocotb.handle.HierarchyObject]):
         return case.__name__ # type: ignore
 
     @classmethod
-    def testcase(cls, fn):
+    def testcase(
+        cls,
+        fn: T.Optional[T.Callable] = None,
+        *,
+        max_cycles: T.Optional[int] = None,
+        max_seconds: T.Optional[float] = None,
+    ):
+        if fn is None:
+            return lambda fn: cls.testcase(fn, max_cycles=max_cycles, max_seconds=max_seconds)
+
         @cocotb.test() # type: ignore
         async def _testcase_wrapper(dut: "Entity"):
             signals = [
@@ -65,18 +82,97 @@ class Entity(T.Type[cocotb.handle.HierarchyObject]):
 
             tracer.set_title(fn.__name__)
 
+            artifacts = Path(lib.WORKSPACE_FOLDER, "sim_build")
+
+            window, after = Waveform.window_from_env()
+
+            if window is not None:
+                tracer.set_window(window, after)
+
+            vectors = os.environ.get("LIB_VECTORS_DIR")
+            replay = os.environ.get("LIB_REPLAY_DIR")
+            log = None if not replay else Path(replay, fn.__name__ + Recorder.log_suffix())
+
+            if vectors or (log is not None and not log.is_file()):
+                tracer.recorder = Recorder(
+                    *[
+                        getattr(dut, key)
+                        for key in sorted(cls._get_input_pins())
+                        if key not in ("clock", "clk") and hasattr(dut, key)
+                    ],
+                    clock=tracer.clock_pin,
+                )
+
+            env_cycles, env_seconds = Watchdog.budget_from_env()
+            watchdog = Watchdog(
+                tracer,
+                max_cycles=max_cycles if max_cycles is not None else env_cycles,
+                max_seconds=max_seconds if max_seconds is not None else env_seconds,
+            )
+
+            activity = Activity_Monitor(*signals) if Activity_Monitor.enabled() else None
+
+            dump = Vcd_Writer.mode()
+
+            if Waveform.arrays_enabled():
+                tracer.record_arrays()
+
+            if Waveform.deferred_from_env():
+                tracer.defer()
+
             with tracer as trace:
+                if activity is not None:
+                    activity.start()
+
+                if dump is not None:
+                    trace.stream(f"{artifacts}/{fn.__name__.lower()}.vcd", fst=dump == "fst")
+
                 await tracer.start()
 
-                pased = all([result async for result in fn(dut, trace)])
+                if log is not None and log.is_file():
+                    results = Recorder.load(log).replay(dut, trace)
+                else:
+                    results = fn(dut, trace)
 
-                if trace.enabled:
-                    trace.write(f"../sim_build/{fn.__name__.lower()}.svg")
+                try:
+                    pased = await watchdog.guard(results)
+                    reason = None
+                except AssertionError as error:
+                    pased = False
+                    reason = str(error)
 
-                if not pased:
-                    message = "\n".join(check.check_log.get_failures()) # type: ignore
+                if tracer.deferred:
+                    pased = trace.verify() and pased
+
+                if activity is not None:
+                    activity.stop()
+                    activity.write(f"{artifacts}/{fn.__name__.lower()}.activity.csv", tracer.cycles)
+
+                if trace.should_render(pased):
+                    trace.write(f"{artifacts}/{fn.__name__.lower()}.{Waveform.output_format()}")
+
+                if Waveform.arrays_enabled():
+                    trace.export(f"{artifacts}/{fn.__name__.lower()}.npz")
 
-                    raise AssertionError(message)
+                if tracer.recorder is not None and vectors and pased:
+                    tracer.recorder.write(Path(vectors, f"{fn.__name__}.vec"))
+
+                if tracer.recorder is not None and log is not None:
+                    tracer.recorder.dump(log.with_name(fn.__name__ + (".log" if pased else ".failed.log")))
+
+                if os.environ.get("LIB_RESULTS"):
+                    with open(os.environ["LIB_RESULTS"], "a") as results_file:
+                        results_file.write(json.dumps({
+                            "testcase": fn.__name__,
+                            "passed": pased,
+                            "cycles": tracer.cycles,
+                        }) + "\n")
+
+                if Check_Table.formats():
+                    trace.checks.write(f"{artifacts}/checks/{fn.__name__.lower()}")
+
+                if not pased:
+                    raise AssertionError(reason or trace.checks.failure_message())
 
         _testcase_wrapper.__name__ = fn.__name__
 
@@ -152,6 +248,24 @@ class Entity(T.Type[cocotb.handle.HierarchyObject]):
         with open(filename, "w") as text_file:
             json.dump(design, text_file, indent=4)
 
+    @classmethod
+    def _get_sources(cls):
+        sources: T.List[str] = []
+
+        if cls._package is not None:
+            packages = cls._package \
+                if isinstance(cls._package, (list, tuple)) \
+                else [cls._package]
+            for pkg in packages:
+                sources.extend(pkg._get_sources())
+
+        for child in cls._get_children():
+            sources.extend(child._get_sources())
+
+        sources.append(str(Path(f"src/{cls.__name__}.vhd").absolute()))
+
+        return list(dict.fromkeys(sources))
+
     @classmethod
     def build_vhd(cls):
         if cls._package is not None:
@@ -224,16 +338,44 @@ class Entity(T.Type[cocotb.handle.HierarchyObject]):
         testcase: T.Any,
         parameters: T.Mapping[str, object] = {},
     ):
-        with check.check() as context:
-            context.set_max_fail(1)
-            runner.test(
-                hdl_toplevel=cls.__name__.lower(),
-                test_args=["--std=08"],
-                test_module="test_" + cls.__name__,
-                testcase=Entity._get_testcase_names(testcase),
-                parameters=parameters,
-                hdl_toplevel_lang="vhdl",
-            )
-
-            if check.any_failures():
-                assert False
+        testcases = Entity._get_testcase_names(testcase)
+        extra_env: T.Dict[str, str] = {"LIB_WORKSPACE": str(lib.WORKSPACE_FOLDER)}
+        build_dir = "sim_build"
+
+        if Coverage.enabled():
+            build_dir = Coverage.build(cls, cls._get_sources())
+
+        if Testbench.enabled():
+            testbench = Testbench(cls, parameters)
+            names = testcases if isinstance(testcases, list) else [testcases]
+
+            if testbench.has_vectors(names):
+                for name in names:
+                    testbench.run(name)
+
+                return
+
+            extra_env["LIB_VECTORS_DIR"] = str(testbench.directory)
+
+        if Recorder.enabled():
+            extra_env["LIB_REPLAY_DIR"] = str(Path("sim_build", "replay", Recorder.digest(cls, parameters)).absolute())
+
+        try:
+            with check.check() as context:
+                context.set_max_fail(1)
+                runner.test(
+                    hdl_toplevel=cls.__name__.lower(),
+                    test_args=["--std=08"],
+                    test_module="test_" + cls.__name__,
+                    testcase=testcases,
+                    parameters=parameters,
+                    hdl_toplevel_lang="vhdl",
+                    extra_env=extra_env,
+                    build_dir=build_dir,
+                )
+
+                if check.any_failures():
+                    assert False
+        finally:
+            if Render_Pool.enabled():
+                Render_Pool.submit_pending(Path(lib.WORKSPACE_FOLDER, "sim_build"))
@@ -0,0 +1,223 @@
+import re
+import json
+import typing as T
+from pathlib import Path
+
+
+TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+body { margin: 0; font: 12px monospace; background: #fff; }
+#bar { position: sticky; top: 0; padding: 4px 8px; background: #eee; border-bottom: 1px solid #ccc; }
+#view { display: flex; }
+#names { flex: none; width: 180px; }
+#names div { height: 24px; line-height: 24px; padding-left: 8px; white-space: nowrap; overflow: hidden; }
+#names div.group { font-weight: bold; background: #f4f4f4; }
+#scroll { flex: 1; overflow-x: scroll; position: relative; }
+#spacer { height: 1px; }
+#canvas { position: sticky; left: 0; display: block; }
+</style>
+</head>
+<body>
+<div id="bar">
+<b>__TITLE__</b>
+<button id="zoom-in">+</button><button id="zoom-out">-</button>
+<span id="position"></span>
+</div>
+<div id="view">
+<div id="names"></div>
+<div id="scroll"><canvas id="canvas"></canvas><div id="spacer"></div></div>
+</div>
+<script id="trace" type="application/json">__TRACE__</script>
+<script>
+"use strict";
+const TRACE = JSON.parse(document.getElementById("trace").textContent);
+const ROW = 24, DATA = "=23456789", FILL = {"7": "#b6f2b6", "9": "#f7b2b2"};
+const scroll = document.getElementById("scroll"), canvas = document.getElementById("canvas");
+const context = canvas.getContext("2d"), names = document.getElementById("names");
+const cache = new Map();
+let width = 16;
+
+for (const row of TRACE.rows) {
+    const div = document.createElement("div");
+    div.textContent = row.name;
+    if (row.group) div.className = "group";
+    names.appendChild(div);
+}
+
+function chunk(row, index) {
+    const key = row.index + ":" + index;
+    if (cache.has(key)) return cache.get(key);
+    const columns = [];
+    let effective = row.heads[index], label = row.offsets[index] - 1;
+    for (const [char, count] of row.chunks[index]) {
+        for (let i = 0; i < count; i++) {
+            let kind = char;
+            if (char === ".") kind = effective;
+            else if (char !== "|") effective = char;
+            if (DATA.includes(char)) label++;
+            columns.push([kind, char === "." || char === "|" ? "" : (DATA.includes(char) ? row.data[label] : ""), char]);
+        }
+    }
+    if (cache.size > 256) cache.delete(cache.keys().next().value);
+    cache.set(key, columns);
+    return columns;
+}
+
+function column(row, position) {
+    const index = Math.floor(position / TRACE.chunk);
+    if (index >= row.chunks.length) return null;
+    return chunk(row, index)[position - index * TRACE.chunk] || null;
+}
+
+function draw() {
+    canvas.width = scroll.clientWidth;
+    canvas.height = TRACE.rows.length * ROW;
+    document.getElementById("spacer").style.width = (TRACE.length * width) + "px";
+    context.clearRect(0, 0, canvas.width, canvas.height);
+    const first = Math.floor(scroll.scrollLeft / width);
+    const last = Math.min(TRACE.length, first + Math.ceil(canvas.width / width) + 1);
+    const offset = scroll.scrollLeft - first * width;
+    document.getElementById("position").textContent = "cycles " + (first + TRACE.tock) + " - " + (last + TRACE.tock);
+    TRACE.rows.forEach((row, y) => {
+        if (row.group) return;
+        const top = y * ROW + 4, bottom = y * ROW + ROW - 4, middle = (top + bottom) / 2;
+        let previous = null;
+        for (let position = first; position < last; position++) {
+            const cell = column(row, position);
+            if (cell === null) break;
+            const [kind, label, char] = cell;
+            const x = (position - first) * width - offset;
+            context.strokeStyle = "#000";
+            context.beginPath();
+            if (char === "|") {
+                context.moveTo(x + width / 2 - 3, bottom); context.lineTo(x + width / 2 + 1, top);
+                context.moveTo(x + width / 2 + 1, bottom); context.lineTo(x + width / 2 + 5, top);
+            } else if (kind === "p" || kind === "P") {
+                context.moveTo(x, bottom); context.lineTo(x, top); context.lineTo(x + width / 2, top);
+                context.lineTo(x + width / 2, bottom); context.lineTo(x + width, bottom);
+            } else if (kind === "1" || kind === "h" || kind === "0" || kind === "l") {
+                const level = kind === "1" || kind === "h" ? top : bottom;
+                if (previous !== null && previous !== level) { context.moveTo(x, previous); context.lineTo(x, level); }
+                context.moveTo(x, level); context.lineTo(x + width, level);
+                previous = level;
+            } else if (kind === "z") {
+                context.moveTo(x, middle); context.lineTo(x + width, middle);
+                previous = null;
+            } else {
+                context.fillStyle = FILL[kind] || (kind === "x" || kind === "u" ? "#ccc" : "#fff");
+                context.fillRect(x, top, width, bottom - top);
+                context.moveTo(x, top); context.lineTo(x + width, top);
+                context.moveTo(x, bottom); context.lineTo(x + width, bottom);
+                if (char !== ".") { context.moveTo(x, top); context.lineTo(x, bottom); }
+                if (label) {
+                    context.fillStyle = "#000";
+                    context.fillText(String(label), x + 2, middle + 4, Math.max(width * 8, 40));
+                }
+                previous = null;
+            }
+            context.stroke();
+        }
+    });
+}
+
+document.getElementById("zoom-in").onclick = () => { width = Math.min(width * 2, 256); draw(); };
+document.getElementById("zoom-out").onclick = () => { width = Math.max(width / 2, 1); draw(); };
+scroll.addEventListener("scroll", () => window.requestAnimationFrame(draw));
+window.addEventListener("resize", draw);
+draw();
+</script>
+</body>
+</html>
+"""
+
+
+class Html_Viewer:
+    CHUNK = 1024
+    DATA = "=23456789"
+    RUNS = re.compile(r"(.)\1*")
+
+    def __init__(self, document: T.Mapping[str, T.Any], chunk: int = CHUNK):
+        self.document = document
+        self.chunk = chunk
+
+    @classmethod
+    def _rows(cls, signals: T.Iterable[T.Any]):
+        rows = []
+
+        for signal in signals:
+            if isinstance(signal, list):
+                rows.append({"name": signal[0], "group": True})
+                rows.extend(cls._rows(signal[1:]))
+            elif signal and "wave" in signal:
+                rows.append(signal)
+
+        return rows
+
+    def _split(self, wave: str):
+        chunks = []
+        heads = []
+        offsets = []
+        effective = "x"
+        data = 0
+
+        for start in range(0, len(wave), self.chunk):
+            runs = [[match.group(1), match.end() - match.start()] for match in self.RUNS.finditer(wave[start:start + self.chunk])]
+
+            heads.append(effective)
+            offsets.append(data)
+            chunks.append(runs)
+
+            for char, count in runs:
+                if char in self.DATA:
+                    data += count
+
+                if char not in ".|":
+                    effective = char
+
+        return chunks, heads, offsets
+
+    def payload(self):
+        rows = []
+        length = 0
+
+        for index, signal in enumerate(self._rows(self.document.get("signal", []))):
+            if signal.get("group"):
+                rows.append({"index": index, "name": signal["name"], "group": True})
+                continue
+
+            data = signal.get("data", [])
+            chunks, heads, offsets = self._split(signal["wave"])
+            length = max(length, len(signal["wave"]))
+
+            rows.append({
+                "index": index,
+                "name": signal["name"],
+                "chunks": chunks,
+                "heads": heads,
+                "offsets": offsets,
+                "data": data.split(" ") if isinstance(data, str) else list(data),
+            })
+
+        head = self.document.get("head", {})
+
+        return {
+            "title": head.get("text", ""),
+            "tock": head.get("tock", 0),
+            "chunk": self.chunk,
+            "length": length,
+            "rows": rows,
+        }
+
+    def write(self, filename: T.Union[str, Path]):
+        payload = self.payload()
+        trace = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+        title = str(payload["title"]).replace("&", "&amp;").replace("<", "&lt;")
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "w") as html_file:
+            html_file.write(TEMPLATE.replace("__TITLE__", title).replace("__TRACE__", trace))
@@ -8,6 +8,17 @@ import lib
 class Package():
     children: T.List[T.Type["Package"]] = []
 
+    @classmethod
+    def _get_sources(cls):
+        sources: T.List[str] = []
+
+        for child in cls.children:
+            sources.extend(child._get_sources())
+
+        sources.append(f"{lib.WORKSPACE_FOLDER}/src/{cls.__name__}.vhd")
+
+        return sources
+
     @classmethod
     def build_vhd(cls, timeout: int = 60):
         for child in cls.children:
@@ -0,0 +1,193 @@
+import os
+import sys
+import json
+import zlib
+import struct
+import hashlib
+import typing as T
+from pathlib import Path
+
+from cocotb.binary import BinaryValue
+
+
+class Recorder:
+    MAGIC = b"LIBREC1\n"
+
+    def __init__(self, *args: T.Any, clock: T.Any = None):
+        self.inputs = {arg._name: arg for arg in args}
+        self.clock = None if clock is None else clock._name
+        self.cycle = 0
+        self.widths: T.Dict[str, int] = {}
+        self.events: T.List[T.Tuple[int, str, str, str]] = []
+        self._values: T.Dict[str, str] = {}
+
+    @staticmethod
+    def enabled():
+        return os.environ.get("LIB_REPLAY", "") not in ("", "0")
+
+    @staticmethod
+    def digest(entity: T.Any, parameters: T.Mapping[str, object] = {}):
+        digest = hashlib.sha1(json.dumps(dict(parameters), sort_keys=True, default=str).encode())
+        module = sys.modules.get(entity.__module__)
+        filename = getattr(module, "__file__", None)
+
+        if filename is not None:
+            digest.update(Path(filename).read_bytes())
+
+        return f"{entity.__name__.lower()}_{digest.hexdigest()[:12]}"
+
+    @staticmethod
+    def log_suffix():
+        return ".failed.log" if os.environ.get("LIB_REPLAY") == "failed" else ".log"
+
+    def sample(self):
+        self.cycle += 1
+
+        for name, pin in self.inputs.items():
+            value = pin.value.binstr
+
+            if self._values.get(name) == value:
+                continue
+
+            self._values[name] = value
+            self.widths[name] = len(value)
+            self.events.append((self.cycle, "D", name, value))
+
+    def check(self, pin: T.Any, value: T.Any):
+        self.widths.setdefault(pin._name, len(pin.value.binstr))
+        self.events.append((self.cycle, "C", pin._name, str(value).upper()))
+
+    def pins(self):
+        names: T.List[str] = []
+
+        for _, _, name, _ in self.events:
+            if name not in names:
+                names.append(name)
+
+        return names
+
+    def write(self, filename: T.Union[str, Path]):
+        names = self.pins()
+        index = {name: key for key, name in enumerate(names)}
+        lines = [f"# clock {self.clock or '-'}"]
+        current = 0
+
+        for key, name in enumerate(names):
+            lines.append(f"P {key} {name} {self.widths[name]}")
+
+        for cycle, kind, name, value in self.events:
+            target = cycle - 1 if kind == "D" else cycle
+
+            if target > current:
+                lines.append(f"S {target - current}")
+                current = target
+
+            lines.append(f"{kind} {index[name]} {value}")
+
+        if self.cycle > current:
+            lines.append(f"S {self.cycle - current}")
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "w") as vectors_file:
+            vectors_file.write("\n".join(lines) + "\n")
+
+    @staticmethod
+    def read_header(filename: T.Union[str, Path]):
+        clock: T.Optional[str] = None
+        pins: T.List[T.Tuple[str, int]] = []
+
+        with open(filename, "r") as vectors_file:
+            for line in vectors_file:
+                if line.startswith("# clock "):
+                    name = line.split()[2]
+                    clock = None if name == "-" else name
+                elif line.startswith("P "):
+                    _, _, name, width = line.split()
+                    pins.append((name, int(width)))
+                elif line.strip() and line[0] not in "#P":
+                    break
+
+        return clock, pins
+
+    def dump(self, filename: T.Union[str, Path]):
+        names = self.pins()
+        index = {name: key for key, name in enumerate(names)}
+        header = json.dumps({
+            "clock": self.clock,
+            "cycles": self.cycle,
+            "pins": [[name, self.widths[name]] for name in names],
+        }).encode()
+        body = bytearray(struct.pack("<I", len(header)) + header)
+
+        for cycle, kind, name, value in self.events:
+            code = 0 if kind == "D" else 1
+
+            if value and set(value) <= {"0", "1"}:
+                data = int(value, 2).to_bytes((len(value) + 7) // 8, "little")
+            else:
+                code |= 0x80
+                data = value.encode()
+
+            body += struct.pack("<IBHH", cycle, code, index[name], len(value)) + data
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(filename, "wb") as log_file:
+            log_file.write(self.MAGIC + zlib.compress(bytes(body)))
+
+    @classmethod
+    def load(cls, filename: T.Union[str, Path]):
+        with open(filename, "rb") as log_file:
+            raw = log_file.read()
+
+        if not raw.startswith(cls.MAGIC):
+            raise ValueError(f"Invalid record log \"{filename}\"!")
+
+        body = zlib.decompress(raw[len(cls.MAGIC):])
+        size, = struct.unpack_from("<I", body, 0)
+        header = json.loads(body[4:4 + size])
+        offset = 4 + size
+        recorder = cls()
+        recorder.clock = header["clock"]
+        recorder.cycle = header["cycles"]
+        recorder.widths = {name: width for name, width in header["pins"]}
+        names = [name for name, _ in header["pins"]]
+
+        while offset < len(body):
+            cycle, code, pin, length = struct.unpack_from("<IBHH", body, offset)
+            offset += 9
+
+            if code & 0x80:
+                value = body[offset:offset + length].decode()
+                offset += length
+            else:
+                count = (length + 7) // 8
+                value = format(int.from_bytes(body[offset:offset + count], "little"), f"0{length}b")
+                offset += count
+
+            recorder.events.append((cycle, "C" if code & 0x7F else "D", names[pin], value))
+
+        return recorder
+
+    async def replay(self, dut: T.Any, trace: T.Any):
+        pins = {name: getattr(dut, name) for name in self.widths}
+        current = 1
+
+        for cycle, kind, name, value in self.events:
+            target = cycle - 1 if kind == "D" else cycle
+
+            if target < current and kind == "D":
+                continue
+
+            if target > current:
+                await trace.cycle(target - current)
+                current = target
+
+            if kind == "D":
+                pins[name].value = BinaryValue(value)
+            else:
+                yield trace.check(pins[name], value)
+
+        if self.cycle > current:
+            await trace.cycle(self.cycle - current)
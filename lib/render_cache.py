@@ -0,0 +1,94 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import typing as T
+from pathlib import Path
+
+import wavedrom
+
+
+class Render_Cache:
+    MAX_AGE = 7 * 24 * 60 * 60
+    _evicted: T.Set[str] = set()
+
+    @staticmethod
+    def directory():
+        directory = os.environ.get("LIB_RENDER_CACHE", "")
+
+        return None if directory in ("", "0") else Path(directory).absolute()
+
+    @classmethod
+    def enabled(cls):
+        return cls.directory() is not None
+
+    @classmethod
+    def max_age(cls):
+        return float(os.environ.get("LIB_RENDER_CACHE_AGE", cls.MAX_AGE))
+
+    @staticmethod
+    def key(source: str):
+        document = json.dumps(json.loads(source), sort_keys=True, separators=(",", ":"))
+        version = getattr(wavedrom, "__version__", "")
+
+        return hashlib.sha256(f"{version}\n{document}".encode()).hexdigest()
+
+    @classmethod
+    def path(cls, source: str):
+        directory = cls.directory()
+
+        if directory is None:
+            return None
+
+        return directory / f"{cls.key(source)}.svg"
+
+    @classmethod
+    def evict(cls, max_age: T.Optional[float] = None):
+        directory = cls.directory()
+
+        if directory is None or not directory.is_dir():
+            return
+
+        deadline = time.time() - (cls.max_age() if max_age is None else max_age)
+
+        for entry in directory.glob("*.svg"):
+            try:
+                if entry.stat().st_mtime < deadline:
+                    entry.unlink()
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def fetch(cls, source: str, filename: T.Union[str, Path]):
+        cached = cls.path(source)
+
+        if cached is None:
+            return False
+
+        if str(cached.parent) not in cls._evicted:
+            cls._evicted.add(str(cached.parent))
+            cls.evict()
+
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            os.utime(cached)
+            shutil.copyfile(cached, filename)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    @classmethod
+    def store(cls, source: str, filename: T.Union[str, Path]):
+        cached = cls.path(source)
+
+        if cached is None:
+            return
+
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+
+        shutil.copyfile(filename, temporary)
+        os.replace(temporary, cached)
@@ -0,0 +1,85 @@
+import os
+import typing as T
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import wavedrom
+
+from lib.render_cache import Render_Cache
+
+
+def render(source: str, filename: str):
+    if Render_Cache.fetch(source, filename):
+        return
+
+    drawing = wavedrom.render(source)
+
+    if drawing is None:
+        raise ValueError("Invalid Wavedrom source!")
+
+    drawing.saveas(filename)
+    Render_Cache.store(source, filename)
+
+
+class Render_Pool:
+    SUFFIX = ".wavedrom"
+    _executor: T.Optional[ProcessPoolExecutor] = None
+    _futures: T.List[T.Tuple[str, Future]] = []
+
+    @staticmethod
+    def workers():
+        return int(os.environ.get("LIB_RENDER_WORKERS", 0) or 0)
+
+    @classmethod
+    def enabled(cls):
+        return cls.workers() > 0
+
+    @classmethod
+    def submit(cls, source: str, filename: str):
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(
+                max_workers=cls.workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        future = cls._executor.submit(render, source, os.path.abspath(filename))
+        cls._futures.append((filename, future))
+
+        return future
+
+    @classmethod
+    def queue(cls, source: str, filename: str):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+        with open(f"{filename}{cls.SUFFIX}", "w") as source_file:
+            source_file.write(source)
+
+    @classmethod
+    def submit_pending(cls, directory: T.Union[str, Path]):
+        for pending in sorted(Path(directory).glob(f"*{cls.SUFFIX}")):
+            try:
+                source = pending.read_text()
+                pending.unlink()
+            except FileNotFoundError:
+                continue
+
+            cls.submit(source, str(pending)[:-len(cls.SUFFIX)])
+
+    @classmethod
+    def flush(cls):
+        futures, cls._futures = cls._futures, []
+        errors = []
+
+        for filename, future in futures:
+            try:
+                future.result()
+            except Exception as error:
+                errors.append(f"{filename}: {error}")
+
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+
+        if errors:
+            raise ValueError("Rendering failed for:\n" + "\n".join(errors))
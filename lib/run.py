@@ -0,0 +1,202 @@
+import os
+import ast
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+import typing as T
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+@dataclass
+class Job:
+    directory: Path
+    module: Path
+    function: str
+    markers: T.Set[str] = field(default_factory=set)
+
+    @property
+    def name(self):
+        return f"{os.path.relpath(self.module)}::{self.function}"
+
+
+@dataclass
+class Result:
+    test: str
+    status: str
+    duration: float
+    cycles: int
+    testcases: T.List[T.Dict[str, T.Any]] = field(default_factory=list)
+    output: str = ""
+
+
+def _markers(function: ast.FunctionDef):
+    markers: T.Set[str] = set()
+
+    for decorator in function.decorator_list:
+        node = decorator.func if isinstance(decorator, ast.Call) else decorator
+
+        if isinstance(node, ast.Attribute) \
+                and isinstance(node.value, ast.Attribute) \
+                and node.value.attr == "mark":
+            markers.add(node.attr)
+
+    return markers
+
+
+def discover(
+    paths: T.Sequence[T.Union[str, Path]] = ("peripherals",),
+    markers: T.Optional[T.Sequence[str]] = ("synthesis", "testcases"),
+    keyword: T.Optional[str] = None,
+):
+    jobs: T.List[Job] = []
+
+    for path in map(Path, paths):
+        modules = [path] if path.is_file() else sorted(path.glob("**/tests/test_*.py"))
+
+        for module in modules:
+            module = module.absolute()
+            tree = ast.parse(module.read_text())
+
+            for node in tree.body:
+                if not isinstance(node, ast.FunctionDef) or not node.name.startswith("test_"):
+                    continue
+
+                job = Job(module.parent.parent, module, node.name, _markers(node))
+
+                if markers is not None and not job.markers & set(markers):
+                    continue
+
+                if keyword is not None and keyword not in job.name:
+                    continue
+
+                jobs.append(job)
+
+    return jobs
+
+
+def _execute(job: Job, worker: str, timeout: T.Optional[float]):
+    with tempfile.TemporaryDirectory() as directory:
+        results = Path(directory, "results.jsonl")
+        env = {
+            **os.environ,
+            "LIB_RESULTS": str(results),
+            "LIB_WORKER": worker,
+        }
+        start = time.monotonic()
+
+        try:
+            process = subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", f"{job.module}::{job.function}"],
+                cwd=job.directory,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=timeout,
+            )
+            status = {0: "passed", 1: "failed", 5: "skipped"}.get(process.returncode, "error")
+            output = process.stdout.decode(errors="replace")
+        except subprocess.TimeoutExpired as error:
+            status = "timeout"
+            output = (error.stdout or b"").decode(errors="replace")
+
+        duration = time.monotonic() - start
+        testcases = []
+
+        if results.is_file():
+            testcases = [json.loads(line) for line in results.read_text().splitlines() if line.strip()]
+
+    return Result(
+        test=job.name,
+        status=status,
+        duration=duration,
+        cycles=sum(testcase["cycles"] for testcase in testcases),
+        testcases=testcases,
+        output=output,
+    )
+
+
+def run(
+    jobs: T.Optional[T.Sequence[Job]] = None,
+    workers: T.Optional[int] = None,
+    timeout: T.Optional[float] = None,
+    progress: T.Optional[T.Callable[[int, int, Result], None]] = None,
+):
+    jobs = list(jobs if jobs is not None else discover())
+    workers = workers or os.cpu_count() or 1
+    builds = [job for job in jobs if "synthesis" in job.markers]
+    tests = [job for job in jobs if "synthesis" not in job.markers]
+    results: T.List[Result] = []
+    directories: T.Dict[Path, T.List[Job]] = {}
+    lock = threading.Lock()
+    slots = threading.local()
+    counter = iter(range(workers))
+
+    for job in builds:
+        directories.setdefault(job.directory, []).append(job)
+
+    def execute(job: Job):
+        if not hasattr(slots, "worker"):
+            with lock:
+                slots.worker = f"w{next(counter)}"
+
+        result = _execute(job, slots.worker, timeout)
+
+        with lock:
+            results.append(result)
+
+            if progress is not None:
+                progress(len(results), len(jobs), result)
+
+    def build(directory_jobs: T.List[Job]):
+        for job in directory_jobs:
+            execute(job)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in as_completed([executor.submit(build, group) for group in directories.values()]):
+            future.result()
+
+        for future in as_completed([executor.submit(execute, job) for job in tests]):
+            future.result()
+
+    return results
+
+
+def print_progress(done: int, total: int, result: Result):
+    print(f"[{done}/{total}] {result.status.upper():<8} {result.test} ({result.duration:.1f}s, {result.cycles} cycles)", flush=True)
+
+    if result.status not in ("passed", "skipped"):
+        print(result.output, flush=True)
+
+
+def main(argv: T.Optional[T.Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Run peripheral testcases concurrently")
+
+    parser.add_argument("paths", nargs="*", type=Path, default=[Path("peripherals")], help="Test modules or directories")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Maximum number of concurrent simulators")
+    parser.add_argument("-m", "--marker", action="append", default=None, help="Markers to run (default: synthesis and testcases)")
+    parser.add_argument("-k", "--keyword", default=None, help="Only run tests whose name contains this text")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="Timeout per test in seconds")
+    parser.add_argument("--json", type=Path, default=None, help="Write structured results to this file")
+
+    args = parser.parse_args(argv)
+    jobs = discover(args.paths, args.marker or ["synthesis", "testcases"], args.keyword)
+    results = run(jobs, args.jobs, args.timeout, print_progress)
+    failed = [result for result in results if result.status not in ("passed", "skipped")]
+
+    print(f"{len(results) - len(failed)} passed, {len(failed)} failed, {sum(result.cycles for result in results)} cycles")
+
+    if args.json is not None:
+        with open(args.json, "w") as json_file:
+            json.dump([{**asdict(result), "output": None} for result in results], json_file, indent=4)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import typing as T
+from array import array
+
+
+class Sample_Store:
+    DATA = "=23456789"
+    UNRESOLVED = str.maketrans("01xzuwlh-", "001111111")
+    RESOLVED = str.maketrans("01xzuwlh-", "010000000")
+
+    def __init__(self, handle: T.Any):
+        self.handle = handle
+        self.name = handle._name.split(".")[-1]
+        self.columns = False
+        self.wide = False
+        self.width = 0
+
+        self.clear()
+
+    def clear(self):
+        self.chars = array("B")
+        self.repeats = array("I")
+        self.data: T.Optional[T.List[T.Any]] = None
+        self.count = 0
+        self._last: T.Optional[str] = None
+        self._binstr: T.Optional[str] = None
+        self._integer = 0
+        self._head: T.Optional[str] = None
+        self._head_label: T.Any = None
+        self.values: T.Any = [] if self.wide else array("Q")
+        self.masks: T.Any = [] if self.wide else array("Q")
+
+    def record(self, width: int):
+        self.width = width
+
+        if self.columns:
+            return
+
+        self.columns = True
+        self.wide = width > 64
+        self.values = [] if self.wide else array("Q")
+        self.masks = [] if self.wide else array("Q")
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        return self.chars.itemsize * len(self.chars) + self.repeats.itemsize * len(self.repeats)
+
+    def _append(self, char: str):
+        code = ord(char)
+
+        if self.chars and self.chars[-1] == code:
+            self.repeats[-1] += 1
+        else:
+            self.chars.append(code)
+            self.repeats.append(1)
+
+        self.count += 1
+
+        if char not in "=.|":
+            self._last = char
+
+    def append_data(self, value: T.Any):
+        if self.data is None:
+            self.data = []
+
+        self.data.append(value)
+
+    def sample(self):
+        value = self.handle.value
+        binstr = value.binstr.lower()
+
+        if len(binstr) == 1:
+            self._append("." if binstr == self._last else binstr)
+
+            if self.columns:
+                self.values.append(binstr == "1")
+                self.masks.append(binstr not in "01")
+
+            return
+
+        if "x" in binstr:
+            char = "x"
+        elif "u" in binstr:
+            char = "u"
+        elif "z" in binstr:
+            char = "z"
+        else:
+            char = None
+
+        if char is not None:
+            if self.columns:
+                self.values.append(int(binstr.translate(self.RESOLVED), 2))
+                self.masks.append(int(binstr.translate(self.UNRESOLVED), 2))
+        else:
+            if binstr != self._binstr:
+                self._binstr = binstr
+                self._integer = int(value)
+
+            if self.columns:
+                self.values.append(self._integer)
+                self.masks.append(0)
+
+            if self.data is None:
+                self.data = []
+
+            if self.data and self.data[-1] == self._integer and self.chars and self.chars[-1] in b"=.":
+                char = "."
+            else:
+                char = "="
+                self.data.append(self._integer)
+
+        self._append(char)
+
+    def gap(self):
+        self._append("|")
+
+    def mark(self, char: str):
+        if not self.chars:
+            return False
+
+        marked = self.chars[-1] in b"79"
+
+        if marked and (char == "7" or self.chars[-1] == ord("9")):
+            return False
+
+        if self.repeats[-1] == 1:
+            self.chars.pop()
+            self.repeats.pop()
+        else:
+            self.repeats[-1] -= 1
+
+        self.count -= 1
+        self._append(char)
+
+        return not marked
+
+    def remark(self, position: int, char: str):
+        index = 0
+        start = 0
+
+        while start + self.repeats[index] <= position:
+            start += self.repeats[index]
+            index += 1
+
+        if chr(self.chars[index]) not in "79" or chr(self.chars[index]) == char:
+            return
+
+        offset = position - start
+        runs = [(self.chars[index], offset), (ord(char), 1), (self.chars[index], self.repeats[index] - offset - 1)]
+        runs = [(code, repeat) for code, repeat in runs if repeat]
+
+        self.chars[index:index + 1] = array("B", [code for code, _ in runs])
+        self.repeats[index:index + 1] = array("I", [repeat for _, repeat in runs])
+
+    def trim(self, keep: int):
+        drop = self.count - keep
+
+        if drop <= 0:
+            return
+
+        index = 0
+        data = 0
+        previous = self._head
+        label = self._head_label
+        carried = True
+
+        while drop >= self.repeats[index]:
+            char = chr(self.chars[index])
+            drop -= self.repeats[index]
+
+            if char in self.DATA:
+                data += self.repeats[index]
+
+            if char not in ".|":
+                previous = char
+                carried = False
+
+            index += 1
+
+        char = chr(self.chars[index])
+
+        if drop and char in self.DATA:
+            data += drop
+
+        if drop and char not in ".|":
+            previous = char
+            carried = False
+
+        if not carried:
+            label = self.data[data - 1] if previous in self.DATA and self.data and 0 < data <= len(self.data) else None
+
+        chars = self.chars[index:]
+        repeats = self.repeats[index:]
+        repeats[0] -= drop
+        index = 0
+        restored = False
+
+        while index < len(chars) and chars[index] == ord("|"):
+            index += 1
+
+        if index < len(chars) and chars[index] == ord("."):
+            head = previous or "x"
+
+            if head in self.DATA:
+                if carried:
+                    restored = True
+                else:
+                    data -= 1
+
+            if repeats[index] == 1:
+                chars[index] = ord(head)
+            else:
+                repeats[index] -= 1
+                chars.insert(index, ord(head))
+                repeats.insert(index, 1)
+
+        self.chars = chars
+        self.repeats = repeats
+        self.count = keep
+
+        if len(self.values) > keep:
+            del self.values[:len(self.values) - keep]
+            del self.masks[:len(self.masks) - keep]
+
+        if self.data is not None:
+            self.data = self.data[data:]
+
+            if restored:
+                self.data.insert(0, label)
+
+        self._head = previous
+        self._head_label = label
+
+    def wave(self):
+        return "".join(chr(char) * repeat for char, repeat in zip(self.chars, self.repeats))
+
+    def get(self, labels: T.Optional[T.Callable[[T.List[T.Any]], str]] = None):
+        signal: T.Dict[str, str] = {"name": self.name, "wave": self.wave()}
+
+        if self.data is not None:
+            signal["data"] = labels(self.data) if labels is not None else " ".join(repr(value) for value in self.data)
+
+        return signal
@@ -0,0 +1,301 @@
+import os
+import re
+import subprocess
+import typing as T
+from pathlib import Path
+
+from lib.recorder import Recorder
+
+
+class Testbench:
+    CLOCK_PERIOD = "20 us"
+
+    def __init__(self, entity: T.Any, parameters: T.Mapping[str, object] = {}):
+        self.entity = entity
+        self.parameters = dict(parameters)
+        self.directory = Path("sim_build", "vectors", Recorder.digest(entity, parameters)).absolute()
+
+    @staticmethod
+    def enabled():
+        return os.environ.get("LIB_VECTORS", "") not in ("", "0")
+
+    def vectors(self, testcase: str):
+        return self.directory / f"{testcase}.vec"
+
+    def has_vectors(self, testcases: T.List[str]):
+        return all(self.vectors(testcase).is_file() for testcase in testcases)
+
+    @staticmethod
+    def _strip_comments(text: str):
+        return re.sub(r"--[^\n]*", "", text)
+
+    @staticmethod
+    def _group(text: str, keyword: str):
+        match = re.search(rf"\b{keyword}\s*\(", text, re.IGNORECASE)
+
+        if match is None:
+            return []
+
+        depth = 0
+        start = match.end()
+
+        for index in range(match.end() - 1, len(text)):
+            if text[index] == "(":
+                depth += 1
+            elif text[index] == ")":
+                depth -= 1
+
+                if depth == 0:
+                    return [
+                        declaration.strip()
+                        for declaration in text[start:index].split(";")
+                        if declaration.strip()
+                    ]
+
+        raise ValueError(f"Unbalanced {keyword} clause!")
+
+    def parse(self):
+        source = Path(f"src/{self.entity.__name__}.vhd").read_text()
+        text = self._strip_comments(source)
+        match = re.search(rf"\bentity\s+{self.entity.__name__}\s+is\b(.*?)\bend\b", text, re.IGNORECASE | re.DOTALL)
+
+        if match is None:
+            raise ValueError(f"Entity {self.entity.__name__} not found!")
+
+        context = [
+            line.strip()
+            for line in text[:match.start()].splitlines()
+            if re.match(r"\s*(library|use)\b", line, re.IGNORECASE)
+        ]
+        header = match.group(1)
+        generics: T.List[T.Tuple[str, str]] = []
+        ports: T.List[T.Tuple[str, str, str]] = []
+
+        port_clause = re.search(r"\bport\s*\(", header, re.IGNORECASE)
+        generic_clause = header if port_clause is None else header[:port_clause.start()]
+
+        for declaration in self._group(generic_clause, "generic"):
+            names, rest = declaration.split(":", 1)
+
+            for name in names.split(","):
+                generics.append((name.strip(), rest.strip()))
+
+        for declaration in self._group(header, "port"):
+            names, rest = declaration.split(":", 1)
+            mode, kind = rest.strip().split(None, 1)
+            kind = kind.split(":=")[0].strip()
+
+            for name in names.split(","):
+                ports.append((name.strip().lower(), mode.lower(), kind))
+
+        return context, generics, ports
+
+    @staticmethod
+    def _kind(kind: str):
+        base = kind.split("(")[0].strip().lower()
+
+        if base in ("std_logic", "std_ulogic"):
+            return "bit"
+        if base in ("std_logic_vector", "std_ulogic_vector"):
+            return "vector"
+        if base in ("unsigned", "signed"):
+            return base
+
+        raise ValueError(f"Unsupported port type \"{kind}\" for vector testbenches!")
+
+    def to_vhdl(self, name: str, vectors: Path):
+        context, generics, ports = self.parse()
+        clock, pins = Recorder.read_header(vectors)
+        clock = None if clock is None else clock.lower()
+        pins = [(pin.lower(), width) for pin, width in pins]
+        kinds = {port: kind for port, _, kind in ports}
+        modes = {port: mode for port, mode, _ in ports}
+
+        for port, mode, _ in ports:
+            if mode == "in" and port != clock and port not in dict(pins):
+                raise ValueError(f"Input port \"{port}\" was never driven, declare it as lib.Entity.Input_pin!")
+
+        variables = []
+        drives = []
+        checks = []
+
+        for index, (pin, width) in enumerate(pins):
+            if pin not in kinds:
+                raise ValueError(f"Pin \"{pin}\" is not a port of {self.entity.__name__}!")
+
+            kind = self._kind(kinds[pin])
+            actual = {
+                "bit": f"tb_{pin}",
+                "vector": f"tb_{pin}",
+                "unsigned": f"std_logic_vector(tb_{pin})",
+                "signed": f"std_logic_vector(tb_{pin})",
+            }[kind]
+            expected = f"v_{index}(0)" if kind == "bit" else f"v_{index}"
+            variables.append(f"        variable v_{index} : std_logic_vector({width - 1} downto 0);")
+
+            if modes[pin] != "out":
+                source = {
+                    "bit": f"v_{index}(0)",
+                    "vector": f"v_{index}",
+                    "unsigned": f"unsigned(v_{index})",
+                    "signed": f"signed(v_{index})",
+                }[kind]
+                drives.append(f"                    when {index} => read(l, v_{index}); tb_{pin} <= {source};")
+
+            checks.extend([
+                f"                    when {index} =>",
+                f"                        read(l, v_{index}, good);",
+                f"                        if not good or ({actual} /= {expected} and ({actual} ?/= {expected}) /= '0') then",
+                f"                            failures := failures + 1;",
+                f"                            report \"cycle \" & integer'image(cycle) & \": pin {pin} expected \" & to_string({expected}) & \" got \" & to_string({actual}) severity error;",
+                f"                        end if;",
+            ])
+
+        if clock is not None:
+            step = [
+                f"                        wait until rising_edge(tb_{clock});",
+                f"                        wait until falling_edge(tb_{clock});",
+            ]
+        else:
+            step = ["                        wait for 1 ns;"]
+
+        generic_clause = [f"        {generic} : {declaration};" for generic, declaration in generics]
+        signals = []
+
+        for port, mode, kind in ports:
+            default = ""
+
+            if port == clock:
+                default = " := '0'"
+            elif mode == "inout":
+                default = " := 'Z'" if self._kind(kind) == "bit" else " := (others => 'Z')"
+
+            signals.append(f"    signal tb_{port} : {kind}{default};")
+
+        lines = [
+            *context,
+            "use std.textio.all;",
+            "",
+            f"entity {name} is",
+            "    generic (",
+            *generic_clause,
+            "        VECTOR_FILE : string",
+            "    );",
+            "end entity;",
+            "",
+            f"architecture TESTBENCH of {name} is",
+            *signals,
+            "begin",
+            f"    dut : entity work.{self.entity.__name__}",
+        ]
+
+        if generics:
+            lines.extend([
+                "        generic map (",
+                ",\n".join(f"            {generic} => {generic}" for generic, _ in generics),
+                "        )",
+            ])
+
+        lines.extend([
+            "        port map (",
+            ",\n".join(f"            {port} => tb_{port}" for port, _, _ in ports),
+            "        );",
+            "",
+        ])
+
+        if clock is not None:
+            lines.extend([
+                "    clock_generator : process",
+                "    begin",
+                f"        tb_{clock} <= '1';",
+                f"        wait for {self.CLOCK_PERIOD} / 2;",
+                f"        tb_{clock} <= '0';",
+                f"        wait for {self.CLOCK_PERIOD} / 2;",
+                "    end process;",
+                "",
+            ])
+
+        lines.extend([
+            "    stimulus : process",
+            "        file vectors_file : text open read_mode is VECTOR_FILE;",
+            "        variable l : line;",
+            "        variable kind : character;",
+            "        variable index : natural;",
+            "        variable count : natural;",
+            "        variable good : boolean;",
+            "        variable cycle : natural := 0;",
+            "        variable failures : natural := 0;",
+            *variables,
+            "    begin",
+            "        while not endfile(vectors_file) loop",
+            "            readline(vectors_file, l);",
+            "            next when l'length = 0;",
+            "            read(l, kind);",
+            "            case kind is",
+            "                when 'D' =>",
+            "                    read(l, index);",
+            "                    case index is",
+            *drives,
+            "                    when others => null;",
+            "                    end case;",
+            "                when 'S' =>",
+            "                    read(l, count);",
+            "                    for step in 1 to count loop",
+            *step,
+            "                    end loop;",
+            "                    cycle := cycle + count;",
+            "                when 'C' =>",
+            "                    read(l, index);",
+            "                    case index is",
+            *checks,
+            "                    when others => null;",
+            "                    end case;",
+            "                when others => null;",
+            "            end case;",
+            "        end loop;",
+            "",
+            "        assert failures = 0 report integer'image(failures) & \" checks failed\" severity failure;",
+            "        std.env.finish;",
+            "    end process;",
+            "end architecture;",
+            "",
+        ])
+
+        return "\n".join(lines)
+
+    def _name(self, testcase: str):
+        name = re.sub(r"_+", "_", f"vectors_{self.directory.name}_{testcase}".lower())
+
+        return name.strip("_")
+
+    def run(self, testcase: str, timeout: T.Optional[int] = None):
+        vectors = self.vectors(testcase)
+        name = self._name(testcase)
+        source = self.directory / f"{name}.vhd"
+        source.write_text(self.to_vhdl(name, vectors))
+
+        commands = [
+            ["ghdl", "-a", "--std=08", "--work=top", str(source)],
+            ["ghdl", "-e", "--std=08", "--work=top", name],
+            [
+                "ghdl",
+                "-r",
+                "--std=08",
+                "--work=top",
+                name,
+                f"-gVECTOR_FILE={vectors}",
+                *[f"-g{key}={value}" for key, value in self.parameters.items()],
+            ],
+        ]
+
+        for command in commands:
+            process = subprocess.Popen(
+                command,
+                cwd="sim_build",
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+
+            outs, errs = process.communicate(timeout=timeout)
+
+            assert process.returncode == 0, outs.decode()
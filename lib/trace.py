@@ -0,0 +1,149 @@
+import json
+import typing as T
+from array import array
+
+import cocotb
+import cocotb.triggers
+import cocotb.utils
+
+from lib.sample_store import Sample_Store
+
+
+class Trace:
+    def __init__(self, *args: T.Any, clk: T.Any = None):
+        self._clock = clk
+        self._signals = [Sample_Store(arg) for arg in args]
+        self._coro = None
+        self._clocks = 0
+        self._enabled = False
+        self._frozen = False
+        self.window: T.Optional[int] = None
+        self.skipped: T.List[T.Tuple[int, int]] = []
+        self.columns = False
+        self.times = array("d")
+
+    async def _monitor(self):
+        while True:
+            await cocotb.triggers.RisingEdge(self._clock)
+            await cocotb.triggers.ReadOnly()
+
+            if not self._enabled or self._frozen:
+                continue
+
+            self._clocks += 1
+
+            for signal in self._signals:
+                signal.sample()
+
+            if self.columns:
+                self.times.append(cocotb.utils.get_sim_time(units="ns"))
+
+            self._roll()
+
+    def _roll(self):
+        if self.window is not None and self._signals and len(self._signals[0]) > 2 * self.window:
+            self.trim(self.window)
+
+    def trim(self, keep: int):
+        if not self._signals or len(self._signals[0]) <= keep:
+            return
+
+        dropped = len(self._signals[0]) - keep
+
+        for signal in self._signals:
+            signal.trim(keep)
+
+        self._clocks = keep
+
+        if len(self.times) > keep:
+            del self.times[:len(self.times) - keep]
+
+        self.skipped = [(index - dropped, count) for index, count in self.skipped if index >= dropped]
+
+    def record(self):
+        if not self.columns:
+            self.columns = True
+            self.times = array("d")
+
+        for signal in self._signals:
+            signal.record(len(signal.handle))
+
+    def freeze(self, keep: T.Optional[int] = None):
+        self._frozen = True
+
+        if keep is not None:
+            self.trim(keep)
+
+    def insert_gap(self, count: T.Optional[int] = None):
+        if self._frozen:
+            return
+
+        self._clocks += 1
+
+        for signal in self._signals:
+            signal.gap()
+
+        if count is not None and self._signals:
+            self.skipped.append((len(self._signals[0]) - 1, count))
+
+    def suspend(self):
+        if self._coro is not None:
+            self._coro.kill()
+            self._coro = None
+
+    def resume(self):
+        if self._coro is None:
+            self._coro = cocotb.start_soon(self._monitor())
+
+    def disable(self):
+        self._enabled = False
+
+    def enable(self):
+        self._enabled = True
+
+    def __enter__(self):
+        for signal in self._signals:
+            signal.clear()
+
+        self._frozen = False
+        self._clocks = 0
+        self.skipped = []
+        self.times = array("d")
+
+        self.enable()
+        self._coro = cocotb.start_soon(self._monitor())
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.suspend()
+
+        for signal in self._signals:
+            signal.clear()
+
+        self.disable()
+
+    def nbytes(self):
+        return sum(signal.nbytes() for signal in self._signals)
+
+    def get(self, labels: T.Optional[T.Callable[[T.List[T.Any]], str]] = None):
+        signals = [signal.get(labels) for signal in self._signals]
+
+        if self._clock is not None:
+            signals.insert(0, {"name": "clock", "wave": "p" + "." * (self._clocks - 1)})
+
+        return signals
+
+    def dumpj(self, header: T.Any = "", footer: T.Any = "", config: T.Any = ""):
+        trace: T.Dict[str, T.Any] = {"signal": self.get()}
+
+        if header:
+            trace["head"] = header if isinstance(header, dict) else {"text": header}
+
+        if footer:
+            trace["foot"] = footer if isinstance(footer, dict) else {"text": footer}
+
+        if config:
+            trace["config"] = config
+
+        return json.dumps(trace, indent=4, sort_keys=False)
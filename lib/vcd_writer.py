@@ -0,0 +1,151 @@
+import os
+import shutil
+import subprocess
+import typing as T
+from pathlib import Path
+from datetime import datetime
+
+import cocotb
+import cocotb.triggers
+import cocotb.utils
+
+
+class Vcd_Writer:
+    LEVELS = {"0": "0", "1": "1", "L": "0", "H": "1", "Z": "z", "z": "z"}
+
+    def __init__(
+        self,
+        *args: T.Any,
+        filename: T.Union[str, Path],
+        scope: str = "top",
+        fst: bool = False,
+        buffering: int = 1 << 16,
+    ):
+        self.signals = list(args)
+        self.filename = Path(filename)
+        self.scope = scope
+        self.fst = fst
+        self.buffering = buffering
+        self.identifiers = [self._identifier(index) for index in range(len(self.signals))]
+        self._values: T.List[T.Optional[str]] = [None] * len(self.signals)
+        self._time: T.Optional[int] = None
+        self._file: T.Optional[T.TextIO] = None
+        self._tasks: T.List[T.Any] = []
+
+    @staticmethod
+    def mode():
+        mode = os.environ.get("LIB_VCD", "").lower()
+
+        if mode in ("", "0"):
+            return None
+
+        if mode not in ("1", "vcd", "fst"):
+            raise ValueError(f"Unknown waveform dump format \"{mode}\"!")
+
+        return "fst" if mode == "fst" else "vcd"
+
+    @staticmethod
+    def _identifier(index: int):
+        identifier = ""
+
+        while True:
+            identifier += chr(33 + index % 94)
+            index //= 94
+
+            if index == 0:
+                return identifier
+
+    @classmethod
+    def _format(cls, signal: T.Any, identifier: str):
+        value = signal.value
+        binstr = value.binstr if hasattr(value, "binstr") else format(int(value), f"0{len(signal)}b")
+        bits = "".join(cls.LEVELS.get(bit, "x") for bit in binstr)
+
+        if len(signal) == 1:
+            return f"{bits}{identifier}\n"
+
+        return f"b{bits} {identifier}\n"
+
+    def _emit(self, index: int):
+        line = self._format(self.signals[index], self.identifiers[index])
+
+        if line == self._values[index]:
+            return
+
+        time = int(cocotb.utils.get_sim_time(units="ps"))
+
+        if time != self._time:
+            self._file.write(f"#{time}\n") # type: ignore
+            self._time = time
+
+        self._file.write(line) # type: ignore
+        self._values[index] = line
+
+    def _header(self):
+        lines = [
+            f"$date {datetime.now().isoformat()} $end",
+            "$version lib.Vcd_Writer $end",
+            "$timescale 1ps $end",
+            f"$scope module {self.scope} $end",
+        ]
+
+        for signal, identifier in zip(self.signals, self.identifiers):
+            lines.append(f"$var wire {len(signal)} {identifier} {signal._name} $end")
+
+        lines += ["$upscope $end", "$enddefinitions $end", f"#{self._time}", "$dumpvars"]
+
+        self._file.write("\n".join(lines) + "\n") # type: ignore
+
+        for index, (signal, identifier) in enumerate(zip(self.signals, self.identifiers)):
+            self._values[index] = self._format(signal, identifier)
+            self._file.write(self._values[index]) # type: ignore
+
+        self._file.write("$end\n") # type: ignore
+
+    async def _monitor(self, index: int):
+        while True:
+            await cocotb.triggers.Edge(self.signals[index])
+
+            self._emit(index)
+
+    def start(self):
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.filename, "w", buffering=self.buffering)
+        self._time = int(cocotb.utils.get_sim_time(units="ps"))
+
+        self._header()
+
+        self._tasks = [cocotb.start_soon(self._monitor(index)) for index in range(len(self.signals))]
+
+    def stop(self):
+        for task in self._tasks:
+            task.kill()
+
+        self._tasks = []
+
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+        if self.fst:
+            self.convert()
+
+    def convert(self):
+        if shutil.which("vcd2fst") is None:
+            cocotb.log.warning(f"vcd2fst not found, keeping {self.filename}")
+            return self.filename
+
+        target = self.filename.with_suffix(".fst")
+        process = subprocess.run(
+            ["vcd2fst", str(self.filename), str(target)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+
+        assert process.returncode == 0, process.stdout.decode()
+
+        os.remove(self.filename)
+
+        return target
@@ -0,0 +1,85 @@
+import typing as T
+
+import numpy as np
+import cocotb.utils
+
+
+class Vector_Driver:
+    def __init__(
+        self,
+        trace: T.Any,
+        inputs: T.Mapping[T.Any, T.Any],
+        outputs: T.Mapping[T.Any, T.Any],
+        max_reports: int = 10,
+    ):
+        self.trace = trace
+        self.inputs = {pin: np.asarray(column) for pin, column in inputs.items()}
+        self.outputs = {pin: np.asarray(column) for pin, column in outputs.items()}
+        self.max_reports = max_reports
+        self.rows = len(next(iter(self.inputs.values())))
+
+        for pin, column in [*self.inputs.items(), *self.outputs.items()]:
+            if len(column) != self.rows:
+                raise ValueError(f"Column for pin \"{pin._name}\" has {len(column)} rows, expected {self.rows}!")
+
+    @staticmethod
+    def _dtype(pin: T.Any):
+        return np.uint64 if len(pin) <= 64 else object
+
+    async def run(self):
+        captured = {pin: np.zeros(self.rows, dtype=self._dtype(pin)) for pin in self.outputs}
+        unresolved = {pin: np.zeros(self.rows, dtype=bool) for pin in self.outputs}
+        drives = [(pin, column.tolist()) for pin, column in self.inputs.items()]
+        samples = [(pin, captured[pin], unresolved[pin]) for pin in self.outputs]
+        recorder = self.trace.recorder
+        cycles = np.zeros(self.rows, dtype=np.uint64)
+        times = np.zeros(self.rows, dtype=np.float64)
+
+        for row in range(self.rows):
+            for pin, column in drives:
+                pin.value = column[row]
+
+            await self.trace.cycle()
+
+            cycles[row] = self.trace.cycles
+            times[row] = cocotb.utils.get_sim_time(units="ns")
+
+            for pin, values, masks in samples:
+                value = pin.value
+
+                if value.is_resolvable:
+                    values[row] = value.integer
+                else:
+                    masks[row] = True
+
+            if recorder is not None:
+                for pin in self.outputs:
+                    recorder.check(pin, format(int(self.outputs[pin][row]), f"0{len(pin)}b"))
+
+        mismatches = np.zeros(self.rows, dtype=bool)
+
+        for pin, expected in self.outputs.items():
+            mismatches |= unresolved[pin] | (captured[pin] != expected.astype(captured[pin].dtype))
+
+        rows = np.flatnonzero(mismatches)
+
+        for index, row in enumerate(rows):
+            stimulus = ", ".join(f"{pin._name}: {int(column[row]):#x}" for pin, column in self.inputs.items()) \
+                if index < self.max_reports \
+                else ""
+
+            for pin, expected in self.outputs.items():
+                actual = "X" if unresolved[pin][row] else f"{int(captured[pin][row]):#x}"
+                wanted = f"{int(expected[row]):#x}"
+
+                self.trace.checks.add(
+                    pin._name,
+                    wanted,
+                    actual,
+                    actual == wanted,
+                    float(times[row]),
+                    int(cycles[row]),
+                    f"Row {row}. {stimulus}" if stimulus else f"Row {row}.",
+                )
+
+        return len(rows) == 0
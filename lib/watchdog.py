@@ -0,0 +1,94 @@
+import os
+import time
+import typing as T
+
+import cocotb
+import cocotb.triggers
+import cocotb.utils
+
+
+class Watchdog:
+    def __init__(
+        self,
+        trace: T.Any,
+        max_cycles: T.Optional[int] = None,
+        max_seconds: T.Optional[float] = None,
+        interval: int = 1000,
+        report_seconds: T.Optional[float] = None,
+    ):
+        self.trace = trace
+        self.max_cycles = max_cycles
+        self.max_seconds = max_seconds
+        self.interval = interval
+        self.report_seconds = report_seconds \
+            if report_seconds is not None \
+            else float(os.environ.get("LIB_REPORT_SECONDS", 10))
+        self.reason: T.Optional[str] = None
+
+    @staticmethod
+    def budget_from_env():
+        max_cycles = os.environ.get("LIB_MAX_CYCLES")
+        max_seconds = os.environ.get("LIB_MAX_SECONDS")
+
+        return (
+            None if not max_cycles else int(max_cycles),
+            None if not max_seconds else float(max_seconds),
+        )
+
+    def _wait(self):
+        if self.trace.clock_pin is not None:
+            return cocotb.triggers.Timer(self.trace.PERIOD * self.interval, units="ns")
+
+        return cocotb.triggers.Timer(self.interval, units="step")
+
+    def _now(self):
+        if self.trace.clock_pin is not None:
+            return int(cocotb.utils.get_sim_time(units="ns")) // self.trace.PERIOD
+
+        return int(cocotb.utils.get_sim_time(units="step"))
+
+    async def run(self):
+        start = time.monotonic()
+        reported_at = start
+        reported_cycles = 0
+        origin = self._now() - self.trace.cycles
+
+        while True:
+            await self._wait()
+
+            now = time.monotonic()
+            cycles = max(self._now() - origin, self.trace.cycles)
+
+            if self.max_cycles is not None and cycles > self.max_cycles:
+                self.reason = f"Watchdog: exceeded budget of {self.max_cycles} cycles"
+                return
+
+            if self.max_seconds is not None and now - start > self.max_seconds:
+                self.reason = f"Watchdog: exceeded budget of {self.max_seconds} s after {cycles} cycles"
+                return
+
+            if now - reported_at >= self.report_seconds:
+                rate = (cycles - reported_cycles) / (now - reported_at)
+
+                cocotb.log.info(f"{self.trace.title}: {cycles} cycles simulated, {rate:.0f} cycles/s")
+
+                reported_at = now
+                reported_cycles = cycles
+
+    async def guard(self, results: T.AsyncIterator[bool]):
+        async def collect():
+            return all([result async for result in results])
+
+        task = cocotb.start_soon(collect())
+        monitor = cocotb.start_soon(self.run())
+
+        await cocotb.triggers.First(task.join(), monitor.join())
+
+        if not task.done():
+            task.kill()
+
+            raise AssertionError(self.reason)
+
+        monitor.kill()
+
+        return task.result()
@@ -1,26 +1,57 @@
+import os
+import re
 import json
 import typing as T
 
-import wavedrom
+import numpy as np
 import cocotb.clock
 import cocotb.triggers
-import cocotb.wavedrom
-import pytest_check as check
+import cocotb.utils
 
+from lib.trace import Trace
+from lib.sample_store import Sample_Store
 from lib.clockless_trace import Clockless_Trace
+from lib.check_table import Check_Table
+from lib.render_pool import Render_Pool, render
+from lib.vcd_writer import Vcd_Writer
+from lib.html_viewer import Html_Viewer
 
 
 class Waveform:
+    PERIOD = 20_000
+    RENDER_MODES = ("always", "failure", "never")
+    STEPPING_MODES = ("double", "single")
+    FORMATS = ("svg", "html")
+    RUNS = re.compile(r"([^.])\1*")
+
     def __init__(self, *args: T.Any, clock: T.Any, model: T.Optional["Entity"] = None):
         self.clock_pin = clock
         self.model = model
         self.scale = 1
         self.enabled = True
         self.title = None
+        self.recorder = None
+        self.cycles = 0
+        self.checks = Check_Table()
+        self.signals = list(args)
+        self.writer: T.Optional[Vcd_Writer] = None
+        self._index: T.Dict[str, Sample_Store] = {}
+        self.window: T.Optional[int] = None
+        self.after = 0
+        self.tock = 0
+        self._freeze_at: T.Optional[int] = None
+        self.idle: T.Optional[int] = int(os.environ["LIB_IDLE_CYCLES"]) if os.environ.get("LIB_IDLE_CYCLES") else None
+        self.stepping = "double"
+        self.deferred = False
+        self._expectations: T.List[T.Tuple[Sample_Store, T.Any, float, int, str, int, int]] = []
+        self._functions: T.List[T.Tuple[Sample_Store, T.Callable[[T.Dict[str, T.Any]], T.Any], str]] = []
+
+        self.set_stepping(os.environ.get("LIB_STEPPING", "double").lower())
 
         if clock is not None:
-            self._trace = cocotb.wavedrom.trace(*args, clk=clock)
-            self.clock = cocotb.clock.Clock(clock, 20_000, units="ns")
+            self._trace = Trace(*args, clk=clock)
+            self.clock = cocotb.clock.Clock(clock, self.PERIOD, units="ns")
+            self._clock_start = int(cocotb.utils.get_sim_time(units="ns"))
 
             cocotb.start_soon(self.clock.start(start_high=True))
         else:
@@ -28,19 +59,111 @@ class Waveform:
 
     def __enter__(self):
         self._trace.__enter__()
+        self._index = {}
+        self._freeze_at = None
+        self.tock = 0
+        self._expectations = []
+        self._functions = []
+
+        for signal in self._trace._signals:
+            self._index.setdefault(signal.name, signal)
+
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.writer is not None:
+            self.writer.stop()
+            self.writer = None
+
         return self._trace.__exit__(exc_type, exc_val, exc_tb)
 
+    def stream(self, filename: str, fst: bool = False):
+        signals = self.signals if self.clock_pin is None else [self.clock_pin, *self.signals]
+
+        self.writer = Vcd_Writer(*signals, filename=filename, scope=self.title or "top", fst=fst)
+        self.writer.start()
+
+    @classmethod
+    def render_mode(cls):
+        mode = os.environ.get("LIB_RENDER", "always").lower()
+
+        if mode not in cls.RENDER_MODES:
+            raise ValueError(f"Unknown render mode \"{mode}\"!")
+
+        return mode
+
+    @classmethod
+    def output_format(cls):
+        extension = os.environ.get("LIB_WAVEFORM", "svg").lower()
+
+        if extension not in cls.FORMATS:
+            raise ValueError(f"Unknown waveform format \"{extension}\"!")
+
+        return extension
+
+    @staticmethod
+    def arrays_enabled():
+        return os.environ.get("LIB_ARRAYS", "") not in ("", "0")
+
+    @staticmethod
+    def deferred_from_env():
+        return os.environ.get("LIB_DEFERRED", "") not in ("", "0")
+
+    def should_render(self, passed: bool):
+        mode = self.render_mode()
+
+        return self.enabled and (mode == "always" or (mode == "failure" and not passed))
+
+    @staticmethod
+    def window_from_env():
+        window = os.environ.get("LIB_FLIGHT_RECORDER")
+
+        if not window:
+            return None, 0
+
+        cycles, _, after = window.partition(",")
+
+        return int(cycles), int(after or 0)
+
+    def set_window(self, cycles: int, after: int = 0):
+        self.window = cycles
+        self.after = after
+        self._trace.window = cycles
+
+    def _freeze(self):
+        if self._freeze_at is None or self.cycles < self._freeze_at or self._trace._frozen:
+            return
+
+        self._trace.freeze(self.window + self.after) # type: ignore
+
+        if self._trace._signals:
+            self.tock = max(self.cycles - len(self._trace._signals[0]), 0)
+
     async def start(self):
         await self.cycle()
 
     def set_scale(self, scale: T.Union[int, float]):
         self.scale = scale
 
+    def set_stepping(self, mode: str):
+        if mode not in self.STEPPING_MODES:
+            raise ValueError(f"Unknown stepping mode \"{mode}\"!")
+
+        self.stepping = mode
+
+    def set_idle(self, cycles: T.Optional[int]):
+        self.idle = cycles
+
+    def defer(self):
+        if self.window is not None:
+            raise ValueError("Deferred checks need the full trace, disable the flight recorder!")
+
+        self.deferred = True
+        self.record_arrays()
+
     def set_title(self, text: str):
         self.title = text
+        self.checks.testcase = text
 
     def disable(self):
         self.enabled = False
@@ -53,13 +176,141 @@ class Waveform:
         self._trace.enable()
 
     async def cycle(self, count: int = 1):
-        if self.clock_pin is not None:
+        if self.clock_pin is not None and self.stepping == "single":
+            falling = cocotb.triggers.FallingEdge(self.clock_pin)
+
+            for _ in range(count):
+                await falling
+
+                if self.recorder is not None:
+                    self.recorder.sample()
+
+                self.cycles += 1
+
+                if self._freeze_at is not None:
+                    self._freeze()
+        elif self.clock_pin is not None:
             for _ in range(count):
                 await cocotb.triggers.RisingEdge(self.clock_pin)
+
+                if self.recorder is not None:
+                    self.recorder.sample()
+
                 await cocotb.triggers.FallingEdge(self.clock_pin)
+
+                self.cycles += 1
+
+                if self._freeze_at is not None:
+                    self._freeze()
         else:
             await cocotb.triggers.Timer(cocotb.triggers.Decimal(1), units="step")
 
+            self.cycles += 1
+
+            if self._freeze_at is not None:
+                self._freeze()
+
+            if self.recorder is not None:
+                self.recorder.sample()
+
+    def _next_falling(self, now: int):
+        edge = self._clock_start + self.PERIOD // 2
+
+        if now >= edge:
+            edge += ((now - edge) // self.PERIOD + 1) * self.PERIOD
+
+        return edge
+
+    @staticmethod
+    def _matches(pin: T.Any, value: T.Any):
+        try:
+            return bool(pin.value == value)
+        except ValueError:
+            return False
+
+    async def wait_any(self, *conditions: T.Tuple[T.Any, T.Any], timeout_cycles: T.Optional[int] = None):
+        for index, (pin, value) in enumerate(conditions):
+            if self._matches(pin, value):
+                return index, 0
+
+        clocked = self.clock_pin is not None
+        units = "ns" if clocked else "step"
+        period = self.PERIOD if clocked else 1
+        now = int(cocotb.utils.get_sim_time(units=units))
+        origin = self._next_falling(now) - self.PERIOD if clocked else now
+        deadline = None if timeout_cycles is None else origin + timeout_cycles * period
+        edges = list(dict.fromkeys(cocotb.triggers.Edge(pin) for pin, _ in conditions))
+        start = self.cycles
+        elapsed = 0
+
+        while True:
+            triggers = list(edges)
+
+            if deadline is not None:
+                triggers.append(cocotb.triggers.Timer(max(deadline - now - period // 4, 1), units=units))
+
+            await cocotb.triggers.First(*triggers)
+
+            # Clockless timers already land on the deadline step
+            if clocked:
+                await cocotb.triggers.FallingEdge(self.clock_pin)
+
+            now = int(cocotb.utils.get_sim_time(units=units))
+            cycles = (now - origin) // period
+
+            if self.recorder is not None and cycles > elapsed:
+                self.recorder.sample()
+                self.recorder.cycle += cycles - elapsed - 1
+
+            elapsed = cycles
+            self.cycles = start + elapsed
+
+            if self._freeze_at is not None:
+                self._freeze()
+
+            for index, (pin, value) in enumerate(conditions):
+                if self._matches(pin, value):
+                    return index, elapsed
+
+            if deadline is not None and now >= deadline:
+                return None, elapsed
+
+    async def wait_for(self, pin: T.Any, value: T.Any, timeout_cycles: T.Optional[int] = None):
+        index, cycles = await self.wait_any((pin, value), timeout_cycles=timeout_cycles)
+
+        return None if index is None else cycles
+
+    async def advance(self, count: int):
+        if count < 1:
+            return
+
+        if self.clock_pin is not None and count < 2:
+            return await self.cycle(count)
+
+        self._trace.insert_gap(count)
+        self._trace.suspend()
+
+        if self.clock_pin is not None:
+            now = int(cocotb.utils.get_sim_time(units="ns"))
+            edge = self._next_falling(now) + (count - 1) * self.PERIOD
+
+            await cocotb.triggers.Timer(edge - self.PERIOD // 4 - now, units="ns")
+        else:
+            await cocotb.triggers.Timer(count, units="step")
+
+        if self.recorder is not None:
+            self.recorder.sample()
+            self.recorder.cycle += count - 1
+
+        if self.clock_pin is not None:
+            await cocotb.triggers.FallingEdge(self.clock_pin)
+
+        self.cycles += count
+        self._trace.resume()
+
+        if self._freeze_at is not None:
+            self._freeze()
+
     async def gap(self, count: int = 1):
         if count < 1:
             return
@@ -70,104 +321,397 @@ class Waveform:
         await self.cycle(count)
         self._trace.enable()
 
-    def check(self, pin: T.Type["Entity.Output_pin"], value: str, message: str = ""):
-        result = check.equal(pin.value.binstr, value, f"At pin \"{pin._name}\". {message}") # type: ignore
+    @staticmethod
+    def _wildcard(actual: str, pattern: str):
+        return len(actual) == len(pattern) and all(
+            expected == "-" or expected == bit for bit, expected in zip(actual.lower(), pattern.lower())
+        )
 
-        for signal in self._trace._signals:
-            if pin._name not in signal._samples: # type: ignore
-                continue
+    def _check(self, pin: T.Any, actual: T.Any, value: T.Any, message: str):
+        binstr = actual.binstr
+        width = None
 
-            signal._samples[pin._name][-1] = "7" if result else "9" # type: ignore
+        if not isinstance(value, str):
+            width = len(binstr)
+            expected, care = (value, -1) if isinstance(value, int) else value
 
-            if len(value) < 2:
-                signal._data[pin._name].append(pin.value) # type: ignore
-
-            break
+            try:
+                passed = (int(binstr, 2) ^ expected) & care & ((1 << width) - 1) == 0
+            except ValueError:
+                passed = self._wildcard(binstr, Check_Table.pattern(value, width))
+        else:
+            passed = binstr == value or ("-" in value and self._wildcard(binstr, value))
+
+        result = self.checks.add(
+            pin._name,
+            value,
+            binstr,
+            passed,
+            cocotb.utils.get_sim_time(units="ns"),
+            self.cycles,
+            message,
+            width,
+        )
+
+        if not result and self.window is not None and self._freeze_at is None:
+            self._freeze_at = self.cycles + self.after
 
         return result
 
-    def check_input(self, pin: T.Type["Entity.Input_pin"], value: str, message: str = ""):
-        result = check.equal(pin.value.binstr, value, f"At pin \"{pin._name}\". {message}") # type: ignore
+    def _mark(self, pin: T.Any, actual: T.Any, value: T.Any, result: bool, label: T.Any):
+        if self.recorder is not None:
+            self.recorder.check(pin, value if isinstance(value, str) else Check_Table.pattern(value, len(actual)))
 
-        for signal in self._trace._signals:
-            if pin._name not in signal._samples: # type: ignore
-                continue
+        signal = self._index.get(pin._name)
 
-            signal._samples[pin._name][-1] = "7" if result else "9" # type: ignore
+        if signal is not None and self.clock_pin is None:
+            self._trace.sample_step(signal) # type: ignore
 
-            if len(value) < 2:
-                signal._data[pin._name].append(str(pin.value)) # type: ignore
+        if signal is not None and not self._trace._frozen and signal.mark("7" if result else "9"):
+            if len(actual) < 2:
+                signal.append_data(label)
 
-            break
+        if self._freeze_at is not None:
+            self._freeze()
 
         return result
 
-    def write(self, filename: str):
-        source = self._trace.dumpj()
-
-
-        if self.model is not None:
-            data = json.loads(source)
-            inputs = self.model._get_input_pins()
-            outputs = self.model._get_output_pins()
-            index = 2
-
-            data["signal"].insert(0, ["IN"])
-            data["signal"].insert(1, ["OUT"])
-
-            for signal in data["signal"][2:]:
-                if signal["name"] == "clock":
-                    signal["wave"] = "P" + signal["wave"][1:]
-
-                if "data" in signal:
-                    if type(signal["data"]) == str:
-                        try:
-                            signal["data"] = " ".join(
-                                "0x" + hex(value)[2:].upper()
-                                for value in map(int, signal["data"].split(" "))
-                            )
-                        except Exception:
-                            pass
-
-                if signal["name"] in inputs:
-                    data["signal"][0].append(data["signal"].pop(index))
-                elif signal["name"] in outputs:
-                    data["signal"][1].append(data["signal"].pop(index))
+    def _covered(self, signal: Sample_Store, now: float):
+        trace = self._trace
+
+        if not trace._enabled or trace._frozen or trace._coro is None:
+            return False
+
+        if self.clock_pin is None:
+            trace.sample_step(signal) # type: ignore
+
+            return len(trace.times) > 0
+
+        return len(trace.times) > 0 and now - trace.times[-1] < self.PERIOD
+
+    def _defer(self, pin: T.Any, value: T.Any, message: str, text: bool = False):
+        signal = self._index.get(pin._name)
+
+        if signal is None or not signal.columns:
+            return False
+
+        if isinstance(value, str):
+            if len(value) != signal.width or value.lower().strip("01-"):
+                return False
+
+        now = cocotb.utils.get_sim_time(units="ns")
+
+        if not self._covered(signal, now):
+            return False
+
+        if self.recorder is not None:
+            self.recorder.check(pin, value if isinstance(value, str) else Check_Table.pattern(value, signal.width))
+
+        if signal.mark("7") and signal.width < 2:
+            label = "x" if signal.masks[-1] else signal.values[-1]
+            signal.append_data(str(label) if text else label)
+
+        self._expectations.append((signal, value, now, self.cycles, message, len(signal) - 1, len(signal.values) - 1))
+
+        return True
+
+    def check(self, pin: T.Type["Entity.Output_pin"], value: T.Any, message: str = ""):
+        value = Check_Table.normalize(value)
+
+        if self.deferred and self._defer(pin, value, message):
+            return True
+
+        actual = pin.value
+        result = self._check(pin, actual, value, message)
+
+        return self._mark(pin, actual, value, result, actual)
+
+    def check_input(self, pin: T.Type["Entity.Input_pin"], value: T.Any, message: str = ""):
+        value = Check_Table.normalize(value)
+
+        if self.deferred and self._defer(pin, value, message, text=True):
+            return True
+
+        actual = pin.value
+        result = self._check(pin, actual, value, message)
+
+        return self._mark(pin, actual, value, result, str(actual))
+
+    def expect(self, pin: T.Any, expected: T.Any, message: str = ""):
+        if not self.deferred:
+            self.defer()
+
+        if not callable(expected):
+            return self.check(pin, expected, message)
+
+        signal = self._index.get(pin._name)
+
+        if signal is None:
+            raise ValueError(f"Pin \"{pin._name}\" is not traced!")
+
+        self._functions.append((signal, expected, message))
+
+        return True
+
+    @staticmethod
+    def _care(value: T.Any, width: int):
+        full = (1 << width) - 1
+        value = Check_Table.normalize(value)
+
+        if isinstance(value, int):
+            return value & full, full
+
+        if isinstance(value, tuple):
+            return value[0] & value[1] & full, value[1] & full
+
+        text = value.lower()
+
+        return int(text.replace("-", "0"), 2), int(text.replace("0", "1").replace("-", "0"), 2)
+
+    @staticmethod
+    def _binstr(value: int, mask: int, width: int):
+        return "".join(
+            "x" if unresolved == "1" else bit
+            for bit, unresolved in zip(format(value, f"0{width}b"), format(mask, f"0{width}b"))
+        )
+
+    def _columns(self, signal: Sample_Store):
+        if signal.wide:
+            return np.array(signal.values, dtype=object), np.array(signal.masks, dtype=object)
+
+        return np.frombuffer(signal.values, dtype=np.uint64), np.frombuffer(signal.masks, dtype=np.uint64)
+
+    def _sample_cycle(self, index: int, time: float, now: float):
+        if self.clock_pin is None:
+            return index
+
+        return max(self.cycles - int((now - time) // self.PERIOD), 0)
+
+    def verify(self):
+        expectations, self._expectations = self._expectations, []
+        functions, self._functions = self._functions, []
+        times = np.frombuffer(self._trace.times, dtype=np.float64)
+        groups: T.Dict[int, T.List[int]] = {}
+        results = np.zeros(len(expectations), dtype=bool)
+        actuals: T.List[T.Optional[str]] = [None] * len(expectations)
+
+        for position, (signal, *_) in enumerate(expectations):
+            groups.setdefault(id(signal), []).append(position)
+
+        for positions in groups.values():
+            signal = expectations[positions[0]][0]
+            indices = np.array([expectations[position][6] for position in positions], dtype=np.intp)
+            values, masks = self._columns(signal)
+            dtype = values.dtype
+            cares = [self._care(expectations[position][1], signal.width) for position in positions]
+            expected = np.array([value for value, _ in cares], dtype=dtype)
+            care = np.array([care for _, care in cares], dtype=dtype)
+            values = values[indices]
+            masks = masks[indices]
+            passed = (((values ^ expected) & care) == 0) & ((masks & care) == 0)
+
+            results[positions] = passed
+
+            for position, value, mask in zip(np.flatnonzero(~passed).tolist(), values[~passed].tolist(), masks[~passed].tolist()):
+                actuals[positions[position]] = self._binstr(value, mask, signal.width)
+
+        for (signal, value, time, cycle, message, position, _), result, actual in zip(expectations, results.tolist(), actuals):
+            self.checks.add(signal.handle._name, value, actual, result, time, cycle, message, signal.width)
+
+            if not result:
+                signal.remark(position, "9")
+
+        now = cocotb.utils.get_sim_time(units="ns")
+        arrays = self.arrays() if functions else {}
+
+        for signal, function, message in functions:
+            expected = np.ma.asarray(function(arrays))
+            values, masks = self._columns(signal)
+
+            if expected.shape != values.shape:
+                raise ValueError(
+                    f"Expected array for pin \"{signal.handle._name}\" has shape {expected.shape}, "
+                    f"but {values.shape} samples were recorded!"
+                )
+
+            full = (1 << signal.width) - 1
+            data = expected.data.astype(values.dtype)
+            passed = ((((data ^ values) & values.dtype.type(full)) == 0) & (masks == 0)) | np.ma.getmaskarray(expected)
+
+            for index in np.flatnonzero(~passed).tolist():
+                self.checks.add(
+                    signal.handle._name,
+                    int(data[index]) & full,
+                    self._binstr(int(values[index]), int(masks[index]), signal.width),
+                    False,
+                    times[index],
+                    self._sample_cycle(index, times[index], now),
+                    message,
+                    signal.width,
+                )
+
+        return not self.checks.failures()
+
+    @staticmethod
+    def _labels(values: T.List[T.Any]):
+        try:
+            return " ".join(
+                f"0x{value:X}" if type(value) is int and value >= 0 else "0x" + hex(int(repr(value)))[2:].upper()
+                for value in values
+            )
+        except Exception:
+            return " ".join(repr(value) for value in values)
+
+    def _compress(self, signals: T.List[T.Dict[str, str]], idle: int):
+        waves = [signal["wave"] for signal in signals if signal["name"] != "clock"]
+
+        if not waves:
+            return signals
+
+        length = max(len(wave) for wave in waves)
+        changes = {0, length}
+
+        for wave in waves:
+            for match in self.RUNS.finditer(wave):
+                if match.group(1) in "xzu":
+                    changes.add(match.start())
                 else:
-                    index += 1
+                    changes.update(range(match.start(), match.end()))
+
+        spans = []
+        previous = None
+
+        for change in sorted(changes):
+            if previous is not None and change - previous - 1 > idle:
+                spans.append((previous + 1, change))
+
+            previous = change
+
+        if not spans:
+            return signals
+
+        def collapse(wave: str):
+            parts = []
+            start = 0
+
+            for begin, end in spans:
+                parts.append(wave[start:begin] + "|")
+                start = end
+
+            return "".join(parts) + wave[start:]
+
+        for signal in signals:
+            signal["wave"] = collapse(signal["wave"])
+
+        marker = collapse("z" * length)
+
+        return [
+            *signals,
+            {
+                "name": "idle",
+                "wave": marker.replace("|", "2"),
+                "data": [f"{end - begin} cycles" for begin, end in spans],
+            },
+        ]
 
-            if len(data["signal"]) > 2:
-                data["signal"].insert(2, {})
+    def document(self):
+        signals = self._trace.get(None if self.model is None else self._labels)
 
-            data.update({
-                "config": {
-                    "hscale": self.scale,
-                },
+        if self._trace.skipped:
+            length = max(len(signal["wave"]) for signal in signals)
+            wave = ["z"] * length
+
+            for index, _ in self._trace.skipped:
+                wave[index] = "2"
+
+            signals.append({
+                "name": "skipped",
+                "wave": "".join(wave),
+                "data": [f"{count} cycles" for _, count in self._trace.skipped],
             })
 
-            if True:
-                data.update({
-                    "head": {
-                        "tock": 0,
-                    },
-                })
+        if self.idle is not None:
+            signals = self._compress(signals, self.idle)
+
+        if self.model is None:
+            return {"signal": signals}
+
+        inputs = self.model._get_input_pins()
+        outputs = self.model._get_output_pins()
+        groups: T.List[T.List[T.Any]] = [["IN"], ["OUT"]]
+        others = []
+
+        for signal in signals:
+            if signal["name"] == "clock":
+                signal["wave"] = "P" + signal["wave"][1:]
+
+            if signal["name"] in inputs:
+                groups[0].append(signal)
+            elif signal["name"] in outputs:
+                groups[1].append(signal)
+            else:
+                others.append(signal)
+
+        head: T.Dict[str, T.Any] = {"tock": self.tock}
+
+        if self.title is not None:
+            head["text"] = self.title
+
+        return {
+            "signal": [*groups, *([{}] if others else []), *others],
+            "config": {
+                "hscale": self.scale,
+            },
+            "head": head,
+        }
+
+    def record_arrays(self):
+        self._trace.record()
 
-            if self.title is not None:
-                data.update({
-                    "head": {
-                        **data["head"],
-                        "text": self.title,
-                    },
-                })
+    def arrays(self):
+        signals = self._trace._signals
+        columns: T.Dict[str, T.Any] = {"time": np.frombuffer(self._trace.times, dtype=np.float64).copy()}
 
-            source = json.dumps(data)
+        for signal in signals:
+            dtype = object if signal.wide else np.uint64
 
-        drawing = wavedrom.render(source)
+            columns[signal.name] = np.array(signal.values, dtype=dtype)
+            columns[f"{signal.name}.mask"] = np.array(signal.masks, dtype=dtype)
+
+        return columns
+
+    def export(self, filename: str):
+        if not self._trace.columns:
+            raise ValueError("Trace arrays are not recorded, call record_arrays() first!")
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        np.savez_compressed(filename, **self.arrays())
+
+    @staticmethod
+    def load_arrays(filename: str):
+        with np.load(filename, allow_pickle=True) as archive:
+            columns = {key: archive[key] for key in archive.files}
+
+        time = columns.pop("time")
+        signals = {
+            name: np.ma.masked_array(values, mask=columns[f"{name}.mask"] != 0)
+            for name, values in columns.items()
+            if not name.endswith(".mask")
+        }
+
+        return time, signals
+
+    def source(self):
+        return json.dumps(self.document())
+
+    def write(self, filename: str):
+        if filename.lower().endswith(".html"):
+            return Html_Viewer(self.document()).write(filename)
 
-        if drawing is not None:
-            return drawing.saveas(filename)
+        if Render_Pool.enabled():
+            return Render_Pool.queue(self.source(), filename)
 
-        raise ValueError("Invalid Wavedrom source!")
+        return render(self.source(), filename)
 
 
 from lib.entity import *
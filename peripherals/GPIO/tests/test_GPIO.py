@@ -240,8 +240,7 @@ async def tb_gpio_input_irq(dut: GPIO, trace: lib.Waveform):
 
    # Rising edge on pin0
     dut.gpio_pins.value = bin32(0x00000001)
-    for _ in range(3):
-        await trace.cycle()
+    await trace.wait_for(dut.irq, "1", timeout_cycles=3)
     yield trace.check(dut.irq, "1", "IRQ on rising edge")
 
     # Clear IRQ
@@ -254,8 +253,7 @@ async def tb_gpio_input_irq(dut: GPIO, trace: lib.Waveform):
 
     # Falling edge on pin0
     dut.gpio_pins.value = bin32(0x00000000)
-    for _ in range(3):
-        await trace.cycle()
+    await trace.wait_for(dut.irq, "1", timeout_cycles=3)
     yield trace.check(dut.irq, "1", "IRQ on falling edge")
 
 
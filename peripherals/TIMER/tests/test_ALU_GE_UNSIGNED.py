@@ -7,6 +7,7 @@
 
 import pytest
 import random
+import numpy as np
 import lib
 from test_GENERICS_package import GENERICS
 from cocotb.binary import BinaryValue
@@ -77,6 +78,26 @@ async def tb_ALU_GE_UNSIGNED(dut: ALU_GE_UNSIGNED, trace: lib.Waveform):
     await apply(dut, trace, half, half - 1, width)
     yield trace.check(dut.ge, '1', f"ge failed: {half} >= {half - 1} expected 1")
 
+# -----------------------------------------------------------------------------
+# Exhaustive sweep driven from NumPy vectors
+# -----------------------------------------------------------------------------
+@ALU_GE_UNSIGNED.testcase
+async def tb_ALU_GE_UNSIGNED_exhaustive(dut: ALU_GE_UNSIGNED, trace: lib.Waveform):
+    """Checks every (A, B) operand pair, comparing all rows at once at the end."""
+    trace.disable()
+
+    width = len(dut.source_1)
+    a, b = np.meshgrid(np.arange(1 << width), np.arange(1 << width), indexing="ij")
+    a, b = a.ravel(), b.ravel()
+
+    driver = lib.Vector_Driver(
+        trace,
+        inputs={dut.source_1: a, dut.source_2: b},
+        outputs={dut.ge: (a >= b).astype(np.uint64)},
+    )
+
+    yield await driver.run()
+
 # -----------------------------------------------------------------------------
 # Synthesis (lint / elaboration) smoke-check
 # -----------------------------------------------------------------------------
@@ -91,6 +112,17 @@ def test_ALU_GE_UNSIGNED_synthesis():
 def test_ALU_GE_UNSIGNED():
     ALU_GE_UNSIGNED.test_with(tb_ALU_GE_UNSIGNED)
 
+@pytest.mark.testcases
+def test_ALU_GE_UNSIGNED_deferred(monkeypatch):
+    monkeypatch.setenv("LIB_DEFERRED", "1")
+    ALU_GE_UNSIGNED.test_with(tb_ALU_GE_UNSIGNED)
+
+@pytest.mark.coverage
+def test_ALU_GE_UNSIGNED_exhaustive_8_bits():
+    ALU_GE_UNSIGNED.test_with(tb_ALU_GE_UNSIGNED_exhaustive, {
+        "DATA_WIDTH": 8,
+    })
+
 # -----------------------------------------------------------------------------
 # Stand-alone entry-point (optional)
 # -----------------------------------------------------------------------------
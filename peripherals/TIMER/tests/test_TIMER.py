@@ -98,40 +98,39 @@ async def tb_timer_hold(dut: TIMER, trace: lib.Waveform):
     await bus_write(dut, trace, WR["config"], 0b1010)  # irq_mask + mode
 
     await bus_read(dut, trace, RD["configs"])
-    yield trace.check(dut.data_out, bv(0b1010, 32), "Config = irq_mask=1, pwm_en=0, mode=1, start=0")
+    yield trace.check(dut.data_out, 0b1010, "Config = irq_mask=1, pwm_en=0, mode=1, start=0")
 
     await bus_write(dut, trace, WR["load_timer"], 0xFFFFFFFC)
     await bus_read(dut, trace, RD["timer"])
-    yield trace.check(dut.data_out, bv(0xFFFFFFFC, 32), "Timer = 0xFFFFFFFC")
+    yield trace.check(dut.data_out, 0xFFFFFFFC, "Timer = 0xFFFFFFFC")
 
     await bus_write(dut, trace, WR["config"], 0b1011)  # start=1
     await bus_read(dut, trace, RD["timer"])
-    yield trace.check(dut.data_out, bv(0xFFFFFFFD, 32), "Timer = 0xFFFFFFFD")
+    yield trace.check(dut.data_out, 0xFFFFFFFD, "Timer = 0xFFFFFFFD")
 
-    await trace.cycle(10)
+    await trace.advance(10)
     await bus_read(dut, trace, RD["timer"])
-    yield trace.check(dut.data_out, bv(0xFFFFFFFF, 32), "Timer = 0xFFFFFFFF")
-    yield trace.check(dut.irq, BinaryValue("1"), "IRQ should be high")
+    yield trace.check(dut.data_out, 0xFFFFFFFF, "Timer = 0xFFFFFFFF")
+    yield trace.check(dut.irq, 1, "IRQ should be high")
 
     await bus_read(dut, trace, RD["ovf_status"])
-    yield trace.check(dut.data_out, bv(1, 32), "IRQ status = 1")
-    yield trace.check(dut.irq, BinaryValue("0"), "IRQ cleared")
+    yield trace.check(dut.data_out, 1, "IRQ status = 1")
+    yield trace.check(dut.irq, 0, "IRQ cleared")
 
     await bus_write(dut, trace, WR["load_top"], 0xF)
     await bus_read(dut, trace, RD["top"])
-    yield trace.check(dut.data_out, bv(0xF, 32), "Top = 0xF")
+    yield trace.check(dut.data_out, 0xF, "Top = 0xF")
 
     await bus_write(dut, trace, WR["reset"], 0)
-    for _ in range(20):
-        await trace.cycle()
+    await trace.wait_for(dut.irq, "1", timeout_cycles=20)
 
     await bus_read(dut, trace, RD["timer"])
-    yield trace.check(dut.data_out, bv(0xF, 32), "Timer = 0xF")
-    yield trace.check(dut.irq, BinaryValue("1"), "IRQ should be high")
+    yield trace.check(dut.data_out, 0xF, "Timer = 0xF")
+    yield trace.check(dut.irq, 1, "IRQ should be high")
 
     await bus_read(dut, trace, RD["ovf_status"])
-    yield trace.check(dut.data_out, bv(1, 32), "IRQ status = 1")
-    yield trace.check(dut.irq, BinaryValue("0"), "IRQ cleared")
+    yield trace.check(dut.data_out, 1, "IRQ status = 1")
+    yield trace.check(dut.irq, 0, "IRQ cleared")
 
 # -----------------------------------------------------------------------------
 # Test Case: Timer in Wrap-Around Mode
@@ -146,35 +145,35 @@ async def tb_timer_wrap(dut: TIMER, trace: lib.Waveform):
     await bus_write(dut, trace, WR["config"], 0b0100)  # keep pwm_en
 
     await bus_read(dut, trace, RD["configs"])
-    yield trace.check(dut.data_out, bv(0b0100, 32), "Config = pwm_en=1")
+    yield trace.check(dut.data_out, 0b0100, "Config = pwm_en=1")
 
     await bus_write(dut, trace, WR["load_top"], 0xF)
     await bus_read(dut, trace, RD["top"])
-    yield trace.check(dut.data_out, bv(0xF, 32), "Top = 0xF")
+    yield trace.check(dut.data_out, 0xF, "Top = 0xF")
 
     await bus_write(dut, trace, WR["load_duty"], 0x8)
     await bus_read(dut, trace, RD["duty"])
-    yield trace.check(dut.data_out, bv(0x8, 32), "Duty = 0x8")
+    yield trace.check(dut.data_out, 0x8, "Duty = 0x8")
 
     await bus_read(dut, trace, RD["pwm"])
-    yield trace.check(dut.data_out, bv(1, 32), "PWM = 1")
+    yield trace.check(dut.data_out, 1, "PWM = 1")
 
     await bus_write(dut, trace, WR["config"], 0b0101)  # pwm_en + start
 
     for i in range(7):
         await bus_read(dut, trace, RD["timer"])
-        yield trace.check(dut.data_out, bv(1 + i, 32), f"Timer = {1 + i}")
-        yield trace.check(dut.pwm, BinaryValue("1"), "PWM = 1")
+        yield trace.check(dut.data_out, 1 + i, f"Timer = {1 + i}")
+        yield trace.check(dut.pwm, 1, "PWM = 1")
 
     for i in range(8):
         await bus_read(dut, trace, RD["timer"])
-        yield trace.check(dut.data_out, bv(8 + i, 32), f"Timer = {8 + i}")
-        yield trace.check(dut.pwm, BinaryValue("0"), "PWM = 0")
+        yield trace.check(dut.data_out, 8 + i, f"Timer = {8 + i}")
+        yield trace.check(dut.pwm, 0, "PWM = 0")
 
     for i in range(8):
         await bus_read(dut, trace, RD["timer"])
-        yield trace.check(dut.data_out, bv(i, 32), f"Timer = {i}")
-        yield trace.check(dut.pwm, BinaryValue("1"), "PWM = 1")
+        yield trace.check(dut.data_out, i, f"Timer = {i}")
+        yield trace.check(dut.pwm, 1, "PWM = 1")
 
 
 @TIMER.testcase
@@ -198,7 +197,7 @@ async def tb_timer_prescaler(dut: TIMER, trace: lib.Waveform):
     # Step 2: Read back the prescaler value and validate
     # -----------------------------------------------------------------------------
     await bus_read(dut, trace, RD["prescaler"])
-    yield trace.check(dut.data_out, bv(4), "Prescaler should be 4")
+    yield trace.check(dut.data_out, 4, "Prescaler should be 4")
 
     # -----------------------------------------------------------------------------
     # Step 3: Load timer with 0 and set TOP = 10
@@ -223,11 +222,11 @@ async def tb_timer_prescaler(dut: TIMER, trace: lib.Waveform):
         # Read timer value (includes a cycle in the operation)
         await bus_read(dut, trace, RD["timer"])
         # Check that the timer value is still i in the first 4 cycles
-        yield trace.check(dut.data_out, bv(i + 1, 32), f"Timer should still be {i} after 3 cycles")
+        yield trace.check(dut.data_out, i + 1, f"Timer should still be {i} after 3 cycles")
         # Read the timer again to confirm it increments
         await bus_read(dut, trace, RD["timer"])
         # Check that the timer value is now i + 2 (due to being the 5th cycle)
-        yield trace.check(dut.data_out, bv(i + 2, 32), f"Timer should now be {i}")
+        yield trace.check(dut.data_out, i + 2, f"Timer should now be {i}")
 
 
 
@@ -133,10 +133,8 @@ async def tb_tx_data_path(dut, trace: lib.Waveform):
     dut.wr_i.value = 0
 
     # wait for interrupt → indicates TX is done (tx_ready & en_tx)
-    for _ in range(100):
-        await trace.cycle()
-        if int(dut.interrupt_o.value) == 1:
-            break
+    await trace.cycle()
+    await trace.wait_for(dut.interrupt_o, 1, timeout_cycles=99)
     yield trace.check(dut.interrupt_o, BinaryValue(1))
 
 
@@ -190,10 +188,8 @@ async def tb_rx_data_path(dut, trace: lib.Waveform):
     await trace.cycle()
 
     # wait for interrupt → indicates RX is done (rx_ready & en_rx)
-    for _ in range(100):
-        await trace.cycle()
-        if int(dut.interrupt_o.value) == 1:
-            break
+    await trace.cycle()
+    await trace.wait_for(dut.interrupt_o, 1, timeout_cycles=99)
     yield trace.check(dut.interrupt_o, BinaryValue(1))
 
     await trace.cycle()